@@ -0,0 +1,11 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'college_news.settings')
+
+app = Celery('college_news')
+
+# All Celery options are read from Django settings prefixed with CELERY_
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -1,4 +1,12 @@
+from django import forms
 from django.contrib import admin
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.models import User
+from .bulk import (
+    archive_articles, delete_articles, delete_comments, delete_user, publish_articles, purge_spam,
+    purgeable_by, recategorize_articles,
+)
 from .models import Category, Article, Comment
 
 @admin.register(Category)
@@ -7,6 +15,25 @@ class CategoryAdmin(admin.ModelAdmin):
     search_fields = ['name', 'description']
     ordering = ['name']
 
+def purge_users(model_admin, request, users):
+    """Purge the `users` request.user may purge and report the ones skipped"""
+    user_ids = list(purgeable_by(request.user, users).values_list('pk', flat=True))
+    skipped = users.exclude(pk__in=user_ids).count()
+    if skipped:
+        model_admin.message_user(
+            request, f'Skipped {skipped} account(s): your own, or staff that only a superuser may purge.',
+            level='warning',
+        )
+    if user_ids:
+        comments, likes = purge_spam(user_ids)
+        model_admin.message_user(
+            request,
+            f'Deactivated {len(user_ids)} user(s); removed {comments} comment(s) and {likes} like(s).',
+        )
+
+class ArticleActionForm(ActionForm):
+    category = forms.ModelChoiceField(queryset=Category.objects.all(), required=False, label='Move to')
+
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'category', 'status', 'published_at', 'views']
@@ -15,8 +42,10 @@ class ArticleAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     date_hierarchy = 'published_at'
     ordering = ['-published_at']
-    readonly_fields = ['views', 'created_at', 'updated_at']
-    
+    readonly_fields = ['views', 'like_count', 'comment_count', 'created_at', 'updated_at']
+    action_form = ArticleActionForm
+    actions = ['publish_selected', 'archive_selected', 'move_selected']
+
     fieldsets = (
         ('Content', {
             'fields': ('title', 'slug', 'content', 'excerpt', 'featured_image')
@@ -29,22 +58,68 @@ class ArticleAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('Statistics', {
-            'fields': ('views',),
+            'fields': ('views', 'like_count', 'comment_count'),
             'classes': ('collapse',)
         }),
     )
 
+    def publish_selected(self, request, queryset):
+        self.message_user(request, f'Published {publish_articles(queryset)} article(s).')
+    publish_selected.short_description = "Publish selected articles"
+
+    def archive_selected(self, request, queryset):
+        self.message_user(request, f'Archived {archive_articles(queryset)} article(s).')
+    archive_selected.short_description = "Archive selected articles"
+
+    def move_selected(self, request, queryset):
+        category = Category.objects.filter(pk=request.POST.get('category') or None).first()
+        if category is None:
+            self.message_user(request, 'Choose a category to move the articles to.', level='error')
+            return
+        moved = recategorize_articles(queryset, category)
+        self.message_user(request, f'Moved {moved} article(s) to {category}.')
+    move_selected.short_description = "Move selected articles to category"
+
+    def delete_queryset(self, request, queryset):
+        # Used by "Delete selected"; skips the per-row collector and signals
+        delete_articles(queryset)
+
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['author', 'article', 'content', 'created_at', 'is_approved']
     list_filter = ['is_approved', 'created_at', 'article']
     search_fields = ['content', 'author__username', 'article__title']
-    actions = ['approve_comments', 'disapprove_comments']
-    
+    actions = ['approve_comments', 'disapprove_comments', 'purge_authors']
+
     def approve_comments(self, request, queryset):
         queryset.update(is_approved=True)
     approve_comments.short_description = "Approve selected comments"
-    
+
     def disapprove_comments(self, request, queryset):
         queryset.update(is_approved=False)
     disapprove_comments.short_description = "Disapprove selected comments"
+
+    def purge_authors(self, request, queryset):
+        authors = User.objects.filter(pk__in=queryset.values('author_id'))
+        purge_users(self, request, authors)
+    purge_authors.short_description = "Deactivate authors and remove all their comments and likes"
+
+    def delete_queryset(self, request, queryset):
+        delete_comments(queryset)
+
+admin.site.unregister(User)
+
+@admin.register(User)
+class NewsUserAdmin(UserAdmin):
+    actions = ['purge_selected']
+
+    def purge_selected(self, request, queryset):
+        purge_users(self, request, queryset)
+    purge_selected.short_description = "Deactivate and remove comments and likes (spam)"
+
+    def delete_queryset(self, request, queryset):
+        for user in queryset:
+            delete_user(user)
+
+    def delete_model(self, request, obj):
+        delete_user(obj)
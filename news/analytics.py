@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+
+from .caching import bump_version, get_version
+from .models import Article
+
+AUTHOR_METRICS_KEY = 'news:author_metrics:{}:{}'
+
+
+def author_version_name(author_id):
+    return f'author:{author_id}'
+
+
+def compute_author_metrics(author_id):
+    """All dashboard figures for one author from a single aggregate query"""
+    totals = Article.objects.filter(author_id=author_id).aggregate(
+        articles=Count('pk'),
+        views=Coalesce(Sum('views'), 0),
+        likes=Coalesce(Sum('like_count'), 0),
+        comments=Coalesce(Sum('comment_count'), 0),
+    )
+    articles = totals['articles']
+    avg_views = articles and totals['views'] // articles or 0
+    avg_likes = articles and totals['likes'] // articles or 0
+
+    # Engagement rate: (likes + comments) / views
+    engagement = totals['likes'] + totals['comments']
+    engagement_rate = totals['views'] and min(100, (engagement / totals['views']) * 100) or 0
+
+    return {
+        **totals,
+        'avg_views': avg_views,
+        'avg_likes': avg_likes,
+        'avg_views_percentage': min(100, avg_views * 10),
+        'avg_likes_percentage': min(100, avg_likes * 20),
+        'engagement_rate': round(engagement_rate, 1),
+    }
+
+
+def get_author_metrics(author_id, cached=True):
+    """Author metrics, memoized until one of the author's articles, likes or comments changes"""
+    if not cached:
+        return compute_author_metrics(author_id)
+    version = get_version(author_version_name(author_id))
+    key = AUTHOR_METRICS_KEY.format(author_id, version)
+    timeout = getattr(settings, 'NEWS_AUTHOR_METRICS_TIMEOUT', 3600)
+    return cache.get_or_set(key, lambda: compute_author_metrics(author_id), timeout)
+
+
+def invalidate_author_metrics(*author_ids):
+    bump_version(*(author_version_name(author_id) for author_id in set(author_ids)))
+
+
+def invalidate_authors_of(article_ids):
+    """Invalidate the metrics of whoever wrote the given articles"""
+    author_ids = Article.objects.filter(
+        pk__in=list(article_ids)
+    ).values_list('author_id', flat=True).distinct()
+    invalidate_author_metrics(*author_ids)
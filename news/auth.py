@@ -0,0 +1,95 @@
+"""
+Per-process cache of authenticated users.
+
+AuthenticationMiddleware loads request.user with one auth_user query on
+every request. CachedAuthenticationMiddleware keeps each logged-in user for
+NEWS_USER_CACHE_TIMEOUT seconds in this process instead. It still checks the
+session's auth hash against the cached user, so a password change logs other
+sessions out exactly as before. Saving or deleting a user drops their entry
+here at once; other processes notice within the timeout, which bounds how long
+a deactivated account keeps working.
+
+Each request gets its own copy of the cached instance, so nothing one request
+sets on request.user leaks into another.
+"""
+import copy
+import threading
+import time
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+
+class UserCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = {}
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._users.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return copy.copy(entry[1])
+
+    def set(self, user):
+        timeout = getattr(settings, 'NEWS_USER_CACHE_TIMEOUT', 30)
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._users[str(user.pk)] = (time.monotonic() + timeout, copy.copy(user))
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._users.pop(str(user_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+
+
+user_cache = UserCache()
+
+
+def get_user(request):
+    """django.contrib.auth.get_user(), answered from the user cache when possible"""
+    session = request.session
+    user_id = session.get(SESSION_KEY)
+    if user_id is not None and session.get(BACKEND_SESSION_KEY) in settings.AUTHENTICATION_BACKENDS:
+        user = user_cache.get(str(user_id))
+        session_hash = session.get(HASH_SESSION_KEY)
+        if user is not None and session_hash and constant_time_compare(session_hash, user.get_session_auth_hash()):
+            return user
+
+    # Cache misses and anything unusual (fallback secrets, a bad hash) take Django's path
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        user_cache.set(user)
+    return user
+
+
+def _get_user(request):
+    if not hasattr(request, '_cached_user'):
+        request._cached_user = get_user(request)
+    return request._cached_user
+
+
+async def _auser(request):
+    if not hasattr(request, '_acached_user'):
+        request._acached_user = await sync_to_async(get_user)(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware backed by the per-process user cache"""
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: _get_user(request))
+        request.auser = partial(_auser, request)
@@ -0,0 +1,13 @@
+"""
+Benchmarks for the news views.
+
+`manage.py benchmark` seeds a throwaway test database at each dataset size,
+drives the main routes through the Django test client and records wall time,
+query count, query time and peak memory per route. Results are written as
+JSON and compared with the baseline stored next to this module. With
+--compare-auth it instead measures the logged-in routes under each session
+and user-cache configuration in AUTH_MODES.
+"""
+from .runner import AUTH_MODES, DATASET_SIZES, ROUTES, compare, run_auth_comparison, run_size
+
+__all__ = ['AUTH_MODES', 'DATASET_SIZES', 'ROUTES', 'compare', 'run_auth_comparison', 'run_size']
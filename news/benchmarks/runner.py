@@ -0,0 +1,191 @@
+import gc
+import statistics
+import time
+import tracemalloc
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from news.auth import user_cache
+from news.models import Article
+from news.seeding import DatasetSeeder
+from news.view_counter import reset_view_buffer
+
+# Dataset sizes passed to DatasetSeeder
+DATASET_SIZES = {
+    'small': {'users': 50, 'categories': 5, 'articles': 200, 'comments': 2000, 'likes': 4000},
+    'medium': {'users': 300, 'categories': 10, 'articles': 2000, 'comments': 20000, 'likes': 60000},
+    'large': {'users': 1000, 'categories': 15, 'articles': 10000, 'comments': 100000, 'likes': 400000},
+}
+
+
+class Fixtures:
+    """Objects the routes point at, picked from the seeded data"""
+
+    def __init__(self):
+        self.staff = User.objects.filter(is_staff=True).order_by('pk').first()
+        self.reader = User.objects.filter(is_staff=False).order_by('pk').first()
+        # The most discussed published article is the heaviest detail page
+        self.article = Article.objects.filter(status='published').order_by('-comment_count', 'pk').first()
+
+
+# name: (url name, method, url kwargs, POST data, who is logged in)
+ROUTES = {
+    'home': ('home', 'get', lambda f: {}, None, 'reader'),
+    'home_anonymous': ('home', 'get', lambda f: {}, None, None),
+    'article_detail': ('article_detail', 'get', lambda f: {'slug': f.article.slug}, None, 'reader'),
+    'dashboard': ('dashboard', 'get', lambda f: {}, None, 'staff'),
+    'article_list': ('article_list', 'get', lambda f: {}, None, 'staff'),
+    'user_list': ('user_list', 'get', lambda f: {}, None, 'staff'),
+    'article_like': ('article_like', 'post', lambda f: {'slug': f.article.slug}, {}, 'reader'),
+    'comment_create': (
+        'comment_create', 'post', lambda f: {'slug': f.article.slug}, {'content': 'Benchmark comment'}, 'reader',
+    ),
+    'comment_list': ('comment_list', 'get', lambda f: {'slug': f.article.slug}, None, 'reader'),
+}
+
+
+# Settings for each session/auth configuration compared by `benchmark --compare-auth`
+AUTH_MODES = {
+    'db': {'SESSION_ENGINE': 'django.contrib.sessions.backends.db', 'NEWS_USER_CACHE_TIMEOUT': 0},
+    'cached': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db',
+        'NEWS_USER_CACHE_TIMEOUT': 30,
+    },
+}
+
+
+def _request(client, method, url, data):
+    if method == 'post':
+        return client.post(url, data, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+    return client.get(url)
+
+
+class QueryTimer:
+    """
+    Execute wrapper counting queries and timing each one with perf_counter.
+    connection.queries rounds its times to whole milliseconds, too coarse for
+    queries that mostly take a fraction of one.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+
+
+def _timed_request(client, method, url, data):
+    """(response, wall seconds, QueryTimer) for one request"""
+    timer = QueryTimer()
+    with connection.execute_wrapper(timer):
+        started = time.perf_counter()
+        response = _request(client, method, url, data)
+        elapsed = time.perf_counter() - started
+    return response, elapsed, timer
+
+
+def measure_route(client, method, url, data, iterations):
+    """Time one route: a cold request after clearing caches, then `iterations` warm ones"""
+    cache.clear()
+    user_cache.clear()
+    reset_view_buffer()
+    response, cold, cold_queries = _timed_request(client, method, url, data)
+    if response.status_code >= 400:
+        raise RuntimeError(f'{method.upper()} {url} returned {response.status_code}')
+
+    warm = [_timed_request(client, method, url, data) for _ in range(iterations)]
+
+    gc.collect()
+    tracemalloc.start()
+    _request(client, method, url, data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'cold_ms': round(cold * 1000, 2),
+        'wall_ms': round(statistics.median(elapsed for _, elapsed, _ in warm) * 1000, 2),
+        'cold_queries': cold_queries.count,
+        'queries': warm[-1][2].count,
+        'query_ms': round(statistics.median(timer.seconds for _, _, timer in warm) * 1000, 3),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def measure_routes(fixtures, routes=None, iterations=5, log=None, label=''):
+    """Measure each route, logging in the route's user on a fresh client"""
+    log = log or (lambda message: None)
+    results = {}
+    for name in routes or ROUTES:
+        url_name, method, kwargs, data, who = ROUTES[name]
+        client = Client()
+        if who:
+            client.force_login(getattr(fixtures, who))
+        url = reverse(url_name, kwargs=kwargs(fixtures))
+        results[name] = measure_route(client, method, url, data, iterations)
+        log(f"[{label}] {name:<16} {results[name]['wall_ms']:>9} ms  {results[name]['queries']:>3} queries")
+    return results
+
+
+def seed_size(size, spec=None, log=None):
+    spec = spec or DATASET_SIZES[size]
+    if log:
+        log(f'[{size}] seeding {spec}')
+    DatasetSeeder(prefix=f'bench-{size}-', **spec).seed()
+    return Fixtures()
+
+
+def run_size(size, spec=None, iterations=5, routes=None, log=None):
+    """Seed a dataset of the given size into the current database and measure every route"""
+    fixtures = seed_size(size, spec, log)
+    return measure_routes(fixtures, routes, iterations, log, size)
+
+
+def run_auth_comparison(size, spec=None, iterations=5, routes=None, log=None):
+    """Measure the logged-in routes under each of AUTH_MODES: {mode: {route: metrics}}"""
+    fixtures = seed_size(size, spec, log)
+    routes = [name for name in routes or ROUTES if ROUTES[name][4]]
+    results = {}
+    for mode, overrides in AUTH_MODES.items():
+        with override_settings(**overrides):
+            results[mode] = measure_routes(fixtures, routes, iterations, log, f'{size} {mode}')
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compare results with a baseline: [(size, route, metric, old, new, status)].
+
+    Query counts must not grow at all; times may drift by `tolerance` either
+    way before they count as a regression or an improvement.
+    """
+    rows = []
+    for size, routes in results.items():
+        for route, metrics in routes.items():
+            old_metrics = baseline.get(size, {}).get(route)
+            if old_metrics is None:
+                rows.append((size, route, None, None, None, 'new'))
+                continue
+            for metric in ('queries', 'wall_ms', 'query_ms', 'peak_kb'):
+                old, new = old_metrics.get(metric), metrics.get(metric)
+                if old is None or new is None:
+                    continue
+                slack = 0 if metric == 'queries' else tolerance
+                if new > old * (1 + slack):
+                    status = 'regression'
+                elif new < old * (1 - slack):
+                    status = 'improvement'
+                else:
+                    status = 'ok'
+                rows.append((size, route, metric, old, new, status))
+    return rows
@@ -0,0 +1,225 @@
+"""
+Set-based bulk operations for moderation and article management.
+
+Each operation walks the selected rows in primary-key order, NEWS_BULK_CHUNK_SIZE
+at a time. Every chunk is one transaction of plain UPDATE/DELETE statements
+that go through no per-row signals or collector. Counters are recomputed only
+for the articles each chunk touched. The caches the signals would have cleared
+are invalidated once at the end. An interrupted run leaves every finished chunk
+consistent and can simply be repeated.
+
+`log` callables receive a progress line after each chunk, as in news.seeding.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, transaction
+from django.db.models import DateTimeField, F, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from taggit.models import TaggedItem
+
+from .analytics import invalidate_author_metrics
+from .auth import user_cache
+from .caching import CONTENT, STATS, bump_version
+from .counters import refresh_comment_count, refresh_like_count
+from .models import Article, ArticleNavigation, Category, Comment
+from .navigation import mark_categories_stale
+from .search import get_search_backend
+from .stats import invalidate_site_stats
+
+
+def chunk_size():
+    return getattr(settings, 'NEWS_BULK_CHUNK_SIZE', 500)
+
+
+def _chunks(queryset, *fields):
+    """Lists of (pk, *fields) rows from `queryset`, walked by primary key"""
+    queryset = queryset.order_by('pk')
+    size = chunk_size()
+    last = None
+    while True:
+        page = queryset if last is None else queryset.filter(pk__gt=last)
+        rows = list(page.values_list('pk', *fields)[:size])
+        if not rows:
+            return
+        yield rows
+        last = rows[-1][0]
+
+
+def _progress(log, verb, done, total):
+    if log:
+        log(f'{verb} {done}/{total}')
+
+
+def _delete_rows(model, column, values):
+    """
+    One DELETE ... WHERE column IN (...). Comment and Article have post_delete
+    receivers, so queryset.delete() would load and signal every row.
+    """
+    connection = connections['default']
+    quote = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(values))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {quote(model._meta.db_table)} '
+            f'WHERE {quote(model._meta.get_field(column).column)} IN ({placeholders})',
+            list(values),
+        )
+        return cursor.rowcount
+
+
+def _listing_changed(author_ids):
+    """Invalidate what depends on the set of published articles"""
+    bump_version(CONTENT, STATS)
+    invalidate_site_stats()
+    invalidate_author_metrics(*author_ids)
+    # Previous/next links cross categories, so every row is rebuilt lazily
+    mark_categories_stale(Category.objects.values_list('pk', flat=True))
+
+
+def _update_articles(queryset, changes, verb, log=None):
+    """Apply `changes` chunk by chunk; returns (updated, author ids, category ids)"""
+    total = queryset.count()
+    done = 0
+    authors, categories = set(), set()
+    for rows in _chunks(queryset, 'author_id', 'category_id'):
+        ids = [pk for pk, _, _ in rows]
+        with transaction.atomic():
+            done += Article.objects.filter(pk__in=ids).update(updated_at=timezone.now(), **changes)
+            if changes.get('status') == 'archived':
+                ArticleNavigation.objects.filter(article_id__in=ids).delete()
+        authors.update(author for _, author, _ in rows)
+        categories.update(category for _, _, category in rows)
+        _progress(log, verb, done, total)
+    return done, authors, categories
+
+
+def publish_articles(queryset, log=None):
+    """Publish the articles, keeping any earlier published_at; returns how many changed"""
+    published_at = Coalesce(F('published_at'), Value(timezone.now(), output_field=DateTimeField()))
+    done, authors, _ = _update_articles(
+        queryset.exclude(status='published'), {'status': 'published', 'published_at': published_at},
+        'published', log,
+    )
+    if done:
+        _listing_changed(authors)
+    return done
+
+
+def archive_articles(queryset, log=None):
+    """Archive the articles; returns how many changed"""
+    done, authors, _ = _update_articles(
+        queryset.exclude(status='archived'), {'status': 'archived'}, 'archived', log,
+    )
+    if done:
+        _listing_changed(authors)
+    return done
+
+
+def recategorize_articles(queryset, category, log=None):
+    """Move the articles into `category`; returns how many moved"""
+    done, _, old_categories = _update_articles(
+        queryset.exclude(category=category), {'category': category}, 'moved', log,
+    )
+    if done:
+        bump_version(CONTENT)
+        invalidate_site_stats()
+        mark_categories_stale(old_categories | {category.pk})
+    return done
+
+
+def delete_articles(queryset, log=None):
+    """Delete the articles with their comments, likes, tags, navigation and index entries"""
+    total = queryset.count()
+    done = 0
+    authors = set()
+    article_type = ContentType.objects.get_for_model(Article)
+    search = get_search_backend()
+    for rows in _chunks(queryset, 'author_id'):
+        ids = [pk for pk, _ in rows]
+        with transaction.atomic():
+            _delete_rows(Comment, 'article', ids)
+            # No signals or dependants, so these are single fast DELETEs
+            Article.likes.through.objects.filter(article_id__in=ids).delete()
+            TaggedItem.objects.filter(content_type=article_type, object_id__in=ids).delete()
+            ArticleNavigation.objects.filter(article_id__in=ids).delete()
+            search.remove_articles(ids)
+            done += _delete_rows(Article, 'id', ids)
+        authors.update(author for _, author in rows)
+        _progress(log, 'deleted articles', done, total)
+    if done:
+        _listing_changed(authors)
+    return done
+
+
+def delete_comments(queryset, log=None):
+    """Delete the comments and recount the articles they were on"""
+    total = queryset.count()
+    done = 0
+    authors = set()
+    for rows in _chunks(queryset, 'article_id', 'article__author_id'):
+        with transaction.atomic():
+            done += _delete_rows(Comment, 'id', [pk for pk, _, _ in rows])
+            refresh_comment_count({article for _, article, _ in rows})
+        authors.update(author for _, _, author in rows)
+        _progress(log, 'deleted comments', done, total)
+    if done:
+        bump_version(CONTENT)
+        invalidate_site_stats()
+        invalidate_author_metrics(*authors)
+    return done
+
+
+def remove_likes_by(user_ids, log=None):
+    """Withdraw every like the users gave and recount the articles concerned"""
+    likes = Article.likes.through.objects.filter(user_id__in=list(user_ids))
+    total = likes.count()
+    done = 0
+    authors = set()
+    for rows in _chunks(likes, 'article_id', 'article__author_id'):
+        with transaction.atomic():
+            deleted, _ = Article.likes.through.objects.filter(pk__in=[pk for pk, _, _ in rows]).delete()
+            done += deleted
+            refresh_like_count({article for _, article, _ in rows})
+        authors.update(author for _, _, author in rows)
+        _progress(log, 'removed likes', done, total)
+    if done:
+        bump_version(STATS)
+        invalidate_site_stats()
+        invalidate_author_metrics(*authors)
+    return done
+
+
+def purgeable_by(user, users):
+    """The accounts in `users` that `user` may purge: never their own, and staff only for a superuser"""
+    users = users.exclude(pk=user.pk)
+    if not user.is_superuser:
+        users = users.filter(is_staff=False, is_superuser=False)
+    return users
+
+
+def purge_spam(user_ids, log=None):
+    """
+    Deactivate the users and remove their comments and likes. Their articles
+    are left for an editor to review. Returns (comments, likes) removed.
+    """
+    user_ids = list(user_ids)
+    User.objects.filter(pk__in=user_ids).update(is_active=False)
+    for user_id in user_ids:
+        user_cache.invalidate(user_id)
+    comments = delete_comments(Comment.objects.filter(author_id__in=user_ids), log)
+    likes = remove_likes_by(user_ids, log)
+    return comments, likes
+
+
+def delete_user(user, log=None):
+    """
+    Delete a user and everything they wrote or liked. The bulky rows go in
+    chunks first, so the final user.delete() only has the small relations
+    (groups, permissions, admin log entries) left to collect.
+    """
+    remove_likes_by([user.pk], log)
+    delete_comments(Comment.objects.filter(author=user), log)
+    delete_articles(Article.objects.filter(author=user), log)
+    user.delete()
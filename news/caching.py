@@ -0,0 +1,101 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = 'news:version:{}'
+CHANGED_KEY = 'news:version-changed:{}'
+FRAGMENT_KEY = 'news:fragment:{}:{}'
+
+# Named content versions. 'content' moves when articles, categories or comments
+# change; 'stats' moves when view counts are flushed or likes change.
+CONTENT = 'content'
+STATS = 'stats'
+
+_stats_lock = threading.Lock()
+_fragment_hits = Counter()
+_fragment_misses = Counter()
+
+
+def _initial_version():
+    # Seeding from the clock keeps a re-created version key (after an eviction or
+    # restart) ahead of the versions baked into fragments that may still be cached
+    return int(time.time() * 1000)
+
+
+def get_versions(*names):
+    """Current value of each named version, initialising missing ones"""
+    keys = {VERSION_KEY.format(name): name for name in names}
+    found = cache.get_many(list(keys))
+    versions = {}
+    for key, name in keys.items():
+        if key not in found:
+            cache.add(key, _initial_version(), None)
+            found[key] = cache.get(key)
+        versions[name] = found[key]
+    return versions
+
+
+def get_version(name=CONTENT):
+    return get_versions(name)[name]
+
+
+def bump_version(*names):
+    """Move the named versions forward so every fragment keyed on them is rebuilt"""
+    names = names or (CONTENT,)
+    for name in names:
+        key = VERSION_KEY.format(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _initial_version(), None)
+    cache.set_many({CHANGED_KEY.format(name): time.time() for name in names}, None)
+
+
+def version_changed_at(name=CONTENT):
+    """Unix time of the last bump_version(name) this cache remembers, or None"""
+    return cache.get(CHANGED_KEY.format(name))
+
+
+def fragment_key(name, vary_on=(), versions=(CONTENT,)):
+    current = get_versions(*versions)
+    parts = [f'{v}={current[v]}' for v in versions] + [str(value) for value in vary_on]
+    digest = hashlib.md5(':'.join(parts).encode(), usedforsecurity=False).hexdigest()
+    return FRAGMENT_KEY.format(name, digest)
+
+
+def get_or_render_fragment(name, render, vary_on=(), versions=(CONTENT,)):
+    """Return the cached fragment for the current versions, rendering it on a miss"""
+    key = fragment_key(name, vary_on, versions)
+    content = cache.get(key)
+    if content is not None:
+        _count(_fragment_hits, name)
+        return content
+    _count(_fragment_misses, name)
+    content = render()
+    cache.set(key, content, getattr(settings, 'NEWS_FRAGMENT_CACHE_TIMEOUT', 3600))
+    return content
+
+
+def _count(counter, name):
+    with _stats_lock:
+        counter[name] += 1
+
+
+def fragment_stats():
+    """Hit/miss counters per fragment name for this process"""
+    with _stats_lock:
+        names = sorted(set(_fragment_hits) | set(_fragment_misses))
+        return {
+            name: {'hits': _fragment_hits[name], 'misses': _fragment_misses[name]}
+            for name in names
+        }
+
+
+def reset_fragment_stats():
+    with _stats_lock:
+        _fragment_hits.clear()
+        _fragment_misses.clear()
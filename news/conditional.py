@@ -0,0 +1,142 @@
+"""
+Conditional GET for the public pages.
+
+A page's ETag is a digest of what its HTML depends on: the content and stats
+versions from news.caching, the timestamps of the rows it shows, the viewer
+(pages carry their name and like state), the session key (login rotates it
+together with the CSRF secret that the pages' forms embed), the query string and
+the static manifest (pages link fingerprinted assets). Last-Modified is the newest
+relevant timestamp. When the client's validators still match, the view
+answers 304 Not Modified before rendering anything.
+
+Pages with flash messages pending are always rendered, so the messages get
+consumed.
+"""
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .caching import CHANGED_KEY, CONTENT, STATS, get_versions, version_changed_at
+from .models import Article
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def make_etag(request, *parts):
+    """A quoted ETag over `parts` plus the viewer, session, query string and static build"""
+    user_id = request.user.pk if request.user.is_authenticated else 0
+    # Read from the cookie, no query. A new login means a new CSRF token, so a
+    # page cached before it would post a token the server no longer accepts
+    session_key = getattr(getattr(request, 'session', None), 'session_key', None) or ''
+    manifest = getattr(staticfiles_storage, 'manifest_hash', '')
+    key = ':'.join(str(part) for part in (*parts, user_id, session_key, request.GET.urlencode(), manifest))
+    return '"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _has_pending_messages(request):
+    return 'messages' in request.COOKIES or '_messages' in getattr(request, 'session', {})
+
+
+def not_modified(request, etag, last_modified):
+    """The 304 (or 412) response when the client's copy is current, else None"""
+    if request.method not in SAFE_METHODS or _has_pending_messages(request):
+        return None
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(request, response, etag, last_modified):
+    if request.method not in SAFE_METHODS or response.status_code not in (200, 304):
+        return response
+    response.headers.setdefault('ETag', etag)
+    if last_modified:
+        response.headers.setdefault('Last-Modified', http_date(last_modified.timestamp()))
+    # Revalidate on every use; authenticated pages must not land in shared caches
+    patch_cache_control(response, no_cache=True)
+    if request.user.is_authenticated:
+        patch_cache_control(response, private=True)
+    return response
+
+
+def content_last_modified():
+    """
+    When published content last changed: the last content version bump, or
+    the newest article update if the cache has forgotten it. No query on the
+    usual path, so a burst of revalidations after an edit stays off the database.
+    """
+    changed = version_changed_at(CONTENT)
+    if changed is None:
+        latest = Article.objects.filter(status='published').aggregate(latest=Max('updated_at'))['latest']
+        if latest is None:
+            return None
+        changed = latest.timestamp()
+        cache.add(CHANGED_KEY.format(CONTENT), changed, None)
+    return datetime.fromtimestamp(changed, tz=timezone.utc)
+
+
+def listing_validators(request):
+    """ETag and Last-Modified for pages built from the published article list"""
+    versions = get_versions(CONTENT, STATS)
+    last_modified = content_last_modified()
+    return make_etag(request, 'listing', versions[CONTENT], versions[STATS], last_modified), last_modified
+
+
+def article_validators(request, article):
+    """
+    ETag and Last-Modified for an article page. `article` needs the
+    newest_comment_at annotation (see views.article_detail).
+    """
+    versions = get_versions(CONTENT, STATS)
+    stamps = [stamp for stamp in (article.updated_at, article.newest_comment_at) if stamp]
+    last_modified = max(stamps) if stamps else None
+    etag = make_etag(request, 'article', article.pk, versions[CONTENT], versions[STATS], *stamps)
+    return etag, last_modified
+
+
+def evaluate(request, validators):
+    """(etag, last_modified, 304 response or None) for `validators(request)`"""
+    etag, last_modified = validators(request)
+    return etag, last_modified, not_modified(request, etag, last_modified)
+
+
+def conditional_page(validators):
+    """
+    Answer conditional GETs for a view whose validators can be computed from
+    the request alone, before the view (or its page cache) runs.
+    """
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method not in SAFE_METHODS:
+                    return await view_func(request, *args, **kwargs)
+                etag, last_modified, response = await sync_to_async(evaluate)(request, validators)
+                if response is None:
+                    response = await view_func(request, *args, **kwargs)
+                return set_validators(request, response, etag, last_modified)
+
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return view_func(request, *args, **kwargs)
+            etag, last_modified, response = evaluate(request, validators)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+            return set_validators(request, response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
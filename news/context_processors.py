@@ -0,0 +1,59 @@
+"""
+Template context shared by every page that extends base_home.html or
+base_dashboard.html.
+
+The header's category menu and "Latest Update" date are cached per content
+version, and the sidebar badges come from the cached site stats, so on a warm
+cache the layout costs no queries. Nothing is loaded until a template reads
+it, so renders that never touch {{ site_chrome }} cost nothing at all.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+
+from .caching import CONTENT, get_version
+from .models import Article, Category
+from .stats import get_site_stats
+
+SITE_CHROME_KEY = 'news:site_chrome:{}'
+
+
+def compute_site_chrome():
+    latest = Article.objects.filter(
+        status='published', published_at__isnull=False
+    ).order_by('-published_at').values_list('published_at', flat=True).first()
+    return {
+        'categories': list(Category.objects.order_by('name').values('id', 'name')),
+        'latest_published_at': latest,
+    }
+
+
+def get_site_chrome():
+    """The header's categories and newest publication date, cached per content version"""
+    key = SITE_CHROME_KEY.format(get_version(CONTENT))
+    timeout = getattr(settings, 'NEWS_FRAGMENT_CACHE_TIMEOUT', 3600)
+    return cache.get_or_set(key, compute_site_chrome, timeout)
+
+
+class SiteChrome:
+    """Each part loads on first use, so a page pays only for what its layout shows"""
+
+    @cached_property
+    def _header(self):
+        return get_site_chrome()
+
+    @property
+    def categories(self):
+        return self._header['categories']
+
+    @property
+    def latest_published_at(self):
+        return self._header['latest_published_at']
+
+    @cached_property
+    def stats(self):
+        return get_site_stats()
+
+
+def site_chrome(request):
+    return {'site_chrome': SiteChrome()}
@@ -0,0 +1,55 @@
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Article, Comment
+
+
+def actual_like_count():
+    """Subquery counting the rows in the likes through table for each article"""
+    likes = Article.likes.through.objects.filter(
+        article_id=OuterRef('pk')
+    ).values('article_id').annotate(total=Count('*')).values('total')
+    return Coalesce(Subquery(likes, output_field=IntegerField()), 0)
+
+
+def actual_comment_count():
+    """Subquery counting the comments attached to each article"""
+    comments = Comment.objects.filter(
+        article_id=OuterRef('pk')
+    ).order_by().values('article_id').annotate(total=Count('*')).values('total')
+    return Coalesce(Subquery(comments, output_field=IntegerField()), 0)
+
+
+def _articles(article_ids):
+    if article_ids is None:
+        return Article.objects.all()
+    return Article.objects.filter(pk__in=article_ids)
+
+
+def refresh_like_count(article_ids=None):
+    """Recompute like_count from the through table in a single UPDATE"""
+    return _articles(article_ids).update(like_count=actual_like_count())
+
+
+def refresh_comment_count(article_ids=None):
+    """Recompute comment_count from the comment table in a single UPDATE"""
+    return _articles(article_ids).update(comment_count=actual_comment_count())
+
+
+def refresh_counters(article_ids=None):
+    """Recompute both engagement counters in a single UPDATE"""
+    return _articles(article_ids).update(
+        like_count=actual_like_count(),
+        comment_count=actual_comment_count(),
+    )
+
+
+def drifted_articles():
+    """Articles whose stored counters disagree with the source tables"""
+    return Article.objects.annotate(
+        actual_likes=actual_like_count(),
+        actual_comments=actual_comment_count(),
+    ).exclude(
+        like_count=F('actual_likes'),
+        comment_count=F('actual_comments'),
+    )
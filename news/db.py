@@ -0,0 +1,130 @@
+"""
+Database connection tuning and read-replica routing.
+
+SQLite connections get WAL journaling and the NEWS_SQLITE_PRAGMAS as they are
+opened, so readers no longer block behind a writer and a busy database waits
+instead of failing with "database is locked".
+
+When NEWS_READ_REPLICA names a database alias, the public read views wrapped
+in @read_from_replica send their queries there; everything else, and every
+write, stays on "default". A visitor who has just made a change is pinned to
+the primary for NEWS_REPLICA_PIN_SECONDS, so replica lag never hides their
+own comment or like from them.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+PIN_COOKIE = 'news_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_read_alias = ContextVar('news_read_alias', default=None)
+
+
+def apply_sqlite_pragmas(sender=None, connection=None, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = getattr(settings, 'NEWS_SQLITE_PRAGMAS', {})
+    # The raw DB-API cursor keeps these out of query logs and the perf counters
+    cursor = connection.connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+    finally:
+        cursor.close()
+
+
+connection_created.connect(apply_sqlite_pragmas)
+
+
+def replica_alias():
+    return getattr(settings, 'NEWS_READ_REPLICA', None)
+
+
+@contextmanager
+def use_replica(alias=None):
+    """Route ORM reads in this block (and threads it hands work to) to the replica"""
+    token = _read_alias.set(alias or replica_alias())
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def _wants_replica(request):
+    return (
+        replica_alias() is not None
+        and request.method in SAFE_METHODS
+        and PIN_COOKIE not in request.COOKIES
+    )
+
+
+def read_from_replica(view_func):
+    """Serve a read-only view's queries from the replica; sync and async views alike"""
+    if iscoroutinefunction(view_func):
+        async def _wrapper_view(request, *args, **kwargs):
+            if not _wants_replica(request):
+                return await view_func(request, *args, **kwargs)
+            with use_replica():
+                return await view_func(request, *args, **kwargs)
+
+        markcoroutinefunction(_wrapper_view)
+    else:
+        def _wrapper_view(request, *args, **kwargs):
+            if not _wants_replica(request):
+                return view_func(request, *args, **kwargs)
+            with use_replica():
+                return view_func(request, *args, **kwargs)
+
+    return wraps(view_func)(_wrapper_view)
+
+
+class ReplicaRouter:
+    """Reads inside use_replica() go to the replica; all writes go to default"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows, so objects read from it may be
+        # attached to ones read from default
+        aliases = {'default', replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+
+class ReplicaPinMiddleware:
+    """Keep a visitor on the primary database for a few seconds after they write"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._pin(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self._pin(request, await self.get_response(request))
+
+    def _pin(self, request, response):
+        if replica_alias() is not None and request.method not in SAFE_METHODS:
+            response.set_cookie(
+                PIN_COOKIE, '1',
+                max_age=getattr(settings, 'NEWS_REPLICA_PIN_SECONDS', 5),
+                httponly=True, samesite='Lax',
+            )
+        return response
@@ -0,0 +1,46 @@
+"""
+Coroutine counterparts of django.contrib.auth's view decorators.
+
+Django 5.0's login_required/user_passes_test wrap views in a sync function,
+which hides a coroutine view from the handler. These resolve the user with
+request.auser() and await the view instead.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.contrib.auth.views import redirect_to_login
+from django.shortcuts import resolve_url
+
+
+def async_user_passes_test(test_func, login_url=None, redirect_field_name=REDIRECT_FIELD_NAME):
+    def decorator(view_func):
+        @wraps(view_func)
+        async def _wrapper_view(request, *args, **kwargs):
+            user = await request.auser()
+            # Share the loaded user with request.user so sync code (templates,
+            # context processors) doesn't fetch it a second time
+            request.user = user
+            if await sync_to_async(test_func)(user):
+                return await view_func(request, *args, **kwargs)
+            return redirect_to_login(
+                request.get_full_path(),
+                resolve_url(login_url or settings.LOGIN_URL),
+                redirect_field_name,
+            )
+
+        return _wrapper_view
+
+    return decorator
+
+
+def async_login_required(function=None, redirect_field_name=REDIRECT_FIELD_NAME, login_url=None):
+    actual_decorator = async_user_passes_test(
+        lambda u: u.is_authenticated,
+        login_url=login_url,
+        redirect_field_name=redirect_field_name,
+    )
+    if function:
+        return actual_decorator(function)
+    return actual_decorator
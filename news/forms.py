@@ -1,6 +1,7 @@
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm, UserCreationForm
 from django.contrib.auth.models import User
+from taggit.forms import TagWidget
 from .models import Article, Comment, Category
 
 class LoginForm(AuthenticationForm):
@@ -35,12 +36,13 @@ class RegisterForm(UserCreationForm):
 class ArticleForm(forms.ModelForm):
     class Meta:
         model = Article
-        fields = ['title', 'content', 'excerpt', 'category', 'status', 'featured_image']
+        fields = ['title', 'content', 'excerpt', 'category', 'tags', 'status', 'featured_image']
         widgets = {
             'title': forms.TextInput(attrs={'class': 'form-control'}),
             'content': forms.Textarea(attrs={'class': 'form-control', 'rows': 10}),
             'excerpt': forms.Textarea(attrs={'class': 'form-control', 'rows': 3}),
             'category': forms.Select(attrs={'class': 'form-control'}),
+            'tags': TagWidget(attrs={'class': 'form-control', 'placeholder': 'Comma-separated tags'}),
             'status': forms.Select(attrs={'class': 'form-control'}),
             'featured_image': forms.FileInput(attrs={'class': 'form-control'}),
         }
@@ -0,0 +1,94 @@
+"""
+Race-free likes.
+
+set_like() changes the likes through table with one INSERT ... ON CONFLICT DO
+NOTHING or one DELETE, and uses the affected row count to decide whether
+Article.like_count moves. The counter is adjusted in the same transaction
+with an F()-style UPDATE that returns the new value, so two concurrent clicks
+can never count twice or leave the counter out of step with the table.
+
+This bypasses likes.add/remove, so the m2m_changed receiver in news.signals
+does not run; the cache invalidation it would have done happens here.
+"""
+from django.db import connections, transaction
+from django.db.models import F
+
+from .analytics import invalidate_author_metrics
+from .caching import STATS, bump_version
+from .models import Article
+
+
+def _quoted(connection):
+    through = Article.likes.through._meta
+    quote = connection.ops.quote_name
+    return (
+        quote(through.db_table),
+        quote(through.get_field('article').column),
+        quote(through.get_field('user').column),
+    )
+
+
+def _insert(cursor, connection, article_id, user_id):
+    table, article_col, user_col = _quoted(connection)
+    cursor.execute(
+        f'INSERT INTO {table} ({article_col}, {user_col}) VALUES (%s, %s) ON CONFLICT DO NOTHING',
+        [article_id, user_id],
+    )
+    return cursor.rowcount
+
+
+def _delete(cursor, connection, article_id, user_id):
+    table, article_col, user_col = _quoted(connection)
+    cursor.execute(
+        f'DELETE FROM {table} WHERE {article_col} = %s AND {user_col} = %s',
+        [article_id, user_id],
+    )
+    return cursor.rowcount
+
+
+def _adjust_count(cursor, connection, article_id, delta):
+    """Move like_count by `delta` and return the new value"""
+    if not connection.features.can_return_columns_from_insert:
+        Article.objects.using(connection.alias).filter(pk=article_id).update(like_count=F('like_count') + delta)
+        return Article.objects.using(connection.alias).values_list('like_count', flat=True).get(pk=article_id)
+    quote = connection.ops.quote_name
+    table, pk = quote(Article._meta.db_table), quote(Article._meta.pk.column)
+    count = quote(Article._meta.get_field('like_count').column)
+    cursor.execute(
+        f'UPDATE {table} SET {count} = {count} + %s WHERE {pk} = %s RETURNING {count}',
+        [delta, article_id],
+    )
+    return cursor.fetchone()[0]
+
+
+def set_like(article_id, user_id, liked=None, author_id=None, using='default'):
+    """
+    Like (liked=True), unlike (liked=False) or toggle (liked=None) an article.
+
+    Repeating a like or an unlike changes nothing. Returns (liked, like_count).
+    Pass author_id when the caller already has it to skip looking it up.
+    """
+    connection = connections[using]
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        if liked is None:
+            # Try the unlike first; if there was nothing to delete, it is a like
+            changed = _delete(cursor, connection, article_id, user_id)
+            liked = not changed
+            if liked:
+                changed = _insert(cursor, connection, article_id, user_id)
+        elif liked:
+            changed = _insert(cursor, connection, article_id, user_id)
+        else:
+            changed = _delete(cursor, connection, article_id, user_id)
+
+        if changed:
+            like_count = _adjust_count(cursor, connection, article_id, 1 if liked else -1)
+        else:
+            like_count = Article.objects.using(using).values_list('like_count', flat=True).get(pk=article_id)
+
+    if changed:
+        if author_id is None:
+            author_id = Article.objects.using(using).values_list('author_id', flat=True).get(pk=article_id)
+        bump_version(STATS)
+        invalidate_author_metrics(author_id)
+    return liked, like_count
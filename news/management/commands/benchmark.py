@@ -0,0 +1,113 @@
+import json
+import platform
+from pathlib import Path
+
+import django
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from news.benchmarks import AUTH_MODES, DATASET_SIZES, ROUTES, compare, run_auth_comparison, run_size
+
+BASELINE_PATH = Path(__file__).resolve().parents[2] / 'benchmarks' / 'baseline.json'
+
+# The manifest storage needs collectstatic output; benchmarks measure the views, not static URLs
+BENCHMARK_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the main views against seeded datasets and compare with the stored baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', default='small,medium',
+            help=f"Comma-separated dataset sizes ({', '.join(DATASET_SIZES)})",
+        )
+        parser.add_argument('--routes', help=f"Comma-separated routes (default: all of {', '.join(ROUTES)})")
+        parser.add_argument('--iterations', type=int, default=5, help='Warm requests per route')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--baseline', default=str(BASELINE_PATH), help='Baseline JSON to compare with')
+        parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative drift in timings')
+        parser.add_argument('--fail-on-regression', action='store_true', help='Exit non-zero on a regression')
+        parser.add_argument(
+            '--compare-auth', action='store_true',
+            help=f"Compare the logged-in routes across session/auth setups ({', '.join(AUTH_MODES)}) instead",
+        )
+
+    def handle(self, *args, **options):
+        sizes = [size.strip() for size in options['sizes'].split(',') if size.strip()]
+        unknown = set(sizes) - set(DATASET_SIZES)
+        if unknown:
+            raise CommandError(f"Unknown size(s): {', '.join(sorted(unknown))}")
+        routes = options['routes'].split(',') if options['routes'] else None
+        if routes and set(routes) - set(ROUTES):
+            raise CommandError(f"Unknown route(s): {', '.join(sorted(set(routes) - set(ROUTES)))}")
+
+        log = self.stdout.write if options['verbosity'] > 0 else None
+        results = {}
+        # Measure in a throwaway test database, never the real one
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with override_settings(STORAGES=BENCHMARK_STORAGES):
+                run = run_auth_comparison if options['compare_auth'] else run_size
+                for size in sizes:
+                    call_command('flush', interactive=False, verbosity=0)
+                    results[size] = run(size, iterations=options['iterations'], routes=routes, log=log)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        payload = {
+            'meta': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'iterations': options['iterations'],
+            },
+            'results': results,
+        }
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(payload, indent=2) + '\n')
+            self.stdout.write(f"Wrote {options['output']}")
+        if options['compare_auth']:
+            self.report_auth(results)
+            return
+        if options['save_baseline']:
+            Path(options['baseline']).write_text(json.dumps(payload, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {options['baseline']}"))
+            return
+
+        baseline_path = Path(options['baseline'])
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING('No baseline to compare with.'))
+            return
+        baseline = json.loads(baseline_path.read_text())['results']
+        regressions = 0
+        for size, route, metric, old, new, status in compare(results, baseline, options['tolerance']):
+            if status == 'ok':
+                continue
+            line = f'{size:<7} {route:<16} {metric or "":<9} {old!s:>10} -> {new!s:<10} {status}'
+            if status == 'regression':
+                regressions += 1
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(self.style.SUCCESS(line) if status == 'improvement' else line)
+        if regressions and options['fail_on_regression']:
+            raise CommandError(f'{regressions} regression(s) against the baseline.')
+        self.stdout.write(f'{regressions} regression(s) against the baseline.')
+
+    def report_auth(self, results):
+        modes = list(AUTH_MODES)
+        self.stdout.write(f"{'size':<7} {'route':<16} " + ' '.join(f'{mode + " ms":>10} {"q":>3}' for mode in modes))
+        for size, by_mode in results.items():
+            for route in by_mode[modes[0]]:
+                cells = ' '.join(
+                    f"{by_mode[mode][route]['wall_ms']:>10} {by_mode[mode][route]['queries']:>3}" for mode in modes
+                )
+                self.stdout.write(f'{size:<7} {route:<16} {cells}')
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from news.view_counter import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = 'Write the shared (redis) buffer of article views to the database (run periodically, e.g. every minute)'
+
+    def handle(self, *args, **options):
+        backend = getattr(settings, 'NEWS_VIEW_COUNTER_BACKEND', 'local')
+        if backend != 'redis':
+            # A local buffer lives inside each web process; this process has none
+            self.stderr.write(self.style.WARNING(
+                f"NEWS_VIEW_COUNTER_BACKEND is {backend!r}: every worker flushes its own buffer "
+                f"each NEWS_VIEW_COUNTER_FLUSH_INTERVAL seconds, so there is nothing to flush here."
+            ))
+            return
+        updated = flush_view_counts()
+        self.stdout.write(self.style.SUCCESS(f'Flushed buffered views for {updated} article(s).'))
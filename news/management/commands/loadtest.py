@@ -0,0 +1,88 @@
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_PATHS = ['/']
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test running servers and compare requests/sec and latency percentiles, '
+        'e.g. loadtest wsgi=http://127.0.0.1:8000 asgi=http://127.0.0.1:8001'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('targets', nargs='+', help='label=base_url pairs to compare')
+        parser.add_argument('--path', action='append', dest='paths', help='Path to request (repeatable, default /)')
+        parser.add_argument('--requests', type=int, default=500, help='Requests per target and path')
+        parser.add_argument('--concurrency', type=int, default=20, help='Concurrent client connections')
+        parser.add_argument('--cookie', default='', help='Cookie header to send, e.g. "sessionid=..."')
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def _fetch(self, url, cookie):
+        request = Request(url, headers={'Cookie': cookie} if cookie else {})
+        started = time.perf_counter()
+        try:
+            with urlopen(request, timeout=30) as response:
+                response.read()
+                ok = response.status < 400
+        except HTTPError as exc:
+            ok = exc.code < 400
+        except URLError:
+            ok = False
+        return time.perf_counter() - started, ok
+
+    def _run(self, url, total, concurrency, cookie):
+        # One untimed request warms up caches and connections
+        self._fetch(url, cookie)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda _: self._fetch(url, cookie), range(total)))
+        elapsed = time.perf_counter() - started
+        latencies = sorted(latency for latency, _ in results)
+        return {
+            'requests': total,
+            'errors': sum(1 for _, ok in results if not ok),
+            'rps': round(total / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+        }
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options['targets']:
+            label, sep, base_url = target.partition('=')
+            if not sep or not base_url.startswith(('http://', 'https://')):
+                raise CommandError(f'Expected label=http://host:port, got {target!r}')
+            targets.append((label, base_url.rstrip('/')))
+
+        results = {}
+        for path in options['paths'] or DEFAULT_PATHS:
+            for label, base_url in targets:
+                stats = self._run(
+                    base_url + path, options['requests'], options['concurrency'], options['cookie']
+                )
+                results.setdefault(path, {})[label] = stats
+                self.stdout.write(
+                    f"{path:<30} {label:<10} {stats['rps']:>8} req/s  "
+                    f"p50 {stats['p50_ms']:>7} ms  p99 {stats['p99_ms']:>7} ms  "
+                    f"errors {stats['errors']}"
+                )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as fh:
+                json.dump(results, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['json_path']}"))
@@ -0,0 +1,33 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from news.bulk import delete_user, purge_spam
+
+
+class Command(BaseCommand):
+    help = "Deactivate users and remove their comments and likes, or delete them with all their content"
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='+')
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete the accounts and their articles as well',
+        )
+
+    def handle(self, *args, **options):
+        users = list(User.objects.filter(username__in=options['usernames']))
+        missing = set(options['usernames']) - {user.username for user in users}
+        if missing:
+            raise CommandError(f"Unknown user(s): {', '.join(sorted(missing))}")
+
+        if options['delete']:
+            for user in users:
+                delete_user(user, log=self.stdout.write)
+                self.stdout.write(self.style.SUCCESS(f'Deleted {user.username}.'))
+            return
+
+        comments, likes = purge_spam([user.pk for user in users], log=self.stdout.write)
+        self.stdout.write(self.style.SUCCESS(
+            f'Deactivated {len(users)} user(s); removed {comments} comment(s) and {likes} like(s).'
+        ))
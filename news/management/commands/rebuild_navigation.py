@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from news.navigation import rebuild_all_navigation
+
+
+class Command(BaseCommand):
+    help = 'Recompute the previous/next and related links of every published article'
+
+    def handle(self, *args, **options):
+        built = rebuild_all_navigation()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt navigation for {built} article(s).'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from news.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for all articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias whose search index should be rebuilt',
+        )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend(options['database'])
+        indexed = backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {indexed} article(s) with {backend.__class__.__name__}.'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from news.models import Article
+from news.renditions import generate_renditions
+
+
+class Command(BaseCommand):
+    help = 'Generate the WebP/JPEG renditions of article featured images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('slugs', nargs='*', help='Only these articles (default: all with an image)')
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-encode renditions that already exist, e.g. after changing NEWS_RENDITION_WIDTHS',
+        )
+
+    def handle(self, *args, **options):
+        articles = Article.objects.exclude(featured_image='').exclude(featured_image__isnull=True)
+        if options['slugs']:
+            articles = articles.filter(slug__in=options['slugs'])
+
+        generated = 0
+        for article in articles.iterator():
+            try:
+                generate_renditions(article, force=options['force'])
+            except (OSError, ValueError) as exc:
+                self.stderr.write(f'{article.slug}: {exc}')
+                continue
+            generated += 1
+        self.stdout.write(self.style.SUCCESS(f'Renditions up to date for {generated} article(s).'))
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news.seeding import DatasetSeeder
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate a deterministic, load-test-sized dataset (users, categories, articles, comments, likes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=12)
+        parser.add_argument('--articles', type=int, default=10000)
+        parser.add_argument('--comments', type=int, default=100000, help='Total comments across all articles')
+        parser.add_argument('--likes', type=int, default=500000, help='Total likes across all articles')
+        parser.add_argument('--seed', type=int, default=1, help='Random seed; the same seed gives the same data')
+        parser.add_argument('--prefix', default='seed', help='Prefix for generated usernames, slugs and categories')
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        seeder = DatasetSeeder(
+            users=options['users'],
+            categories=options['categories'],
+            articles=options['articles'],
+            comments=options['comments'],
+            likes=options['likes'],
+            seed=options['seed'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+            log=self.stdout.write if options['verbosity'] > 1 else None,
+        )
+        if options['users'] < 1 or options['categories'] < 1:
+            raise CommandError('At least one user and one category are needed.')
+        if seeder.exists():
+            raise CommandError(
+                f'Data for prefix {seeder.prefix!r} already exists; use another --prefix or --seed.'
+            )
+
+        started = time.monotonic()
+        created = seeder.seed()
+        summary = ', '.join(f'{count} {name}' for name, count in created.items())
+        self.stdout.write(self.style.SUCCESS(f'Created {summary} in {time.monotonic() - started:.1f}s.'))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from news.counters import drifted_articles, refresh_counters
+
+
+class Command(BaseCommand):
+    help = 'Reconcile the stored like_count/comment_count columns with the likes and comments tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted articles without fixing them',
+        )
+
+    def handle(self, *args, **options):
+        drifted = list(drifted_articles().values_list(
+            'pk', 'slug', 'like_count', 'actual_likes', 'comment_count', 'actual_comments'
+        ))
+
+        for pk, slug, like_count, actual_likes, comment_count, actual_comments in drifted:
+            self.stdout.write(
+                f'{slug}: likes {like_count} -> {actual_likes}, '
+                f'comments {comment_count} -> {actual_comments}'
+            )
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('All article counters are in sync.'))
+            return
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} article(s) have drifted counters.'))
+            return
+
+        refresh_counters([row[0] for row in drifted])
+        self.stdout.write(self.style.SUCCESS(f'Reconciled counters on {len(drifted)} article(s).'))
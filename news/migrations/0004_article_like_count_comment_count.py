@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-10-17 01:39
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    Article = apps.get_model('news', 'Article')
+    Comment = apps.get_model('news', 'Comment')
+    likes = Article.likes.through.objects.filter(
+        article_id=OuterRef('pk')
+    ).values('article_id').annotate(total=Count('*')).values('total')
+    comments = Comment.objects.filter(
+        article_id=OuterRef('pk')
+    ).order_by().values('article_id').annotate(total=Count('*')).values('total')
+    Article.objects.update(
+        like_count=Coalesce(Subquery(likes, output_field=IntegerField()), 0),
+        comment_count=Coalesce(Subquery(comments, output_field=IntegerField()), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_alter_comment_is_approved'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
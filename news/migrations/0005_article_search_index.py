@@ -0,0 +1,54 @@
+# Generated by Django 5.0.6 on 2026-10-17 02:10
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS news_article_fts "
+            "USING fts5(title, excerpt, body, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            "INSERT INTO news_article_fts (rowid, title, excerpt, body) "
+            "SELECT id, title, excerpt, content FROM news_article"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE TABLE IF NOT EXISTS news_article_search ("
+            "article_id bigint PRIMARY KEY REFERENCES news_article (id) "
+            "ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            "document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS news_article_search_document_gin "
+            "ON news_article_search USING gin (document)"
+        )
+        schema_editor.execute(
+            "INSERT INTO news_article_search (article_id, document) "
+            "SELECT id, "
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'C') "
+            "FROM news_article"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS news_article_fts")
+    elif vendor == 'postgresql':
+        schema_editor.execute("DROP TABLE IF EXISTS news_article_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_article_like_count_comment_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
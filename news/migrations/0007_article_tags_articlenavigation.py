@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-10-17 01:52
+
+import django.db.models.deletion
+import taggit.managers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_article_comment_indexes'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='tags',
+            field=taggit.managers.TaggableManager(blank=True, help_text='A comma-separated list of tags.', through='taggit.TaggedItem', to='taggit.Tag', verbose_name='Tags'),
+        ),
+        migrations.CreateModel(
+            name='ArticleNavigation',
+            fields=[
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='navigation', serialize=False, to='news.article')),
+                ('previous', models.JSONField(blank=True, null=True)),
+                ('next', models.JSONField(blank=True, null=True)),
+                ('related', models.JSONField(blank=True, default=list)),
+                ('is_stale', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news.category')),
+            ],
+        ),
+    ]
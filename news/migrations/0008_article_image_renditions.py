@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-17 02:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_article_tags_articlenavigation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+from taggit.managers import TaggableManager
 
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -29,14 +30,34 @@ class Article(models.Model):
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='articles')
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft')
     featured_image = models.ImageField(upload_to='articles/', blank=True, null=True)
+    # Resized copies of featured_image, written by news.renditions
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(blank=True, null=True)
     views = models.PositiveIntegerField(default=0)
     likes = models.ManyToManyField(User, related_name='liked_articles', blank=True)
+    tags = TaggableManager(blank=True)
+    # Denormalized engagement counters, kept in sync by news.signals
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
     
     class Meta:
         ordering = ['-published_at', '-created_at']
+        indexes = [
+            # Public listings: status='published' ordered by date or popularity
+            models.Index(fields=['status', 'published_at'], name='article_status_pub_idx'),
+            models.Index(fields=['status', 'views'], name='article_status_views_idx'),
+            models.Index(fields=['category', 'status', 'published_at'], name='article_cat_status_pub_idx'),
+            # Keyset pagination and prev/next lookups over published articles only
+            models.Index(
+                fields=['published_at', 'id'],
+                condition=models.Q(status='published'),
+                name='article_published_idx',
+            ),
+            # Dashboard and article_list for a single author
+            models.Index(fields=['author', 'created_at'], name='article_author_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -46,12 +67,6 @@ class Article(models.Model):
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
 
-    def like_count(self):
-        return self.likes.count()
-
-    def comment_count(self):
-        return self.comments.count()
-
     def is_liked_by(self, user):
         return self.likes.filter(pk=user.pk).exists() if user.is_authenticated else False
 
@@ -64,6 +79,24 @@ class Comment(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['article', 'created_at'], name='comment_article_created_idx'),
+        ]
     
     def __str__(self):
         return f'Comment by {self.author.username} on {self.article.title}'
+
+
+class ArticleNavigation(models.Model):
+    """Precomputed previous/next and related links for a published article (see news.navigation)"""
+    article = models.OneToOneField(Article, on_delete=models.CASCADE, primary_key=True, related_name='navigation')
+    # Category the related list was built from, so a move can invalidate the old one
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='+')
+    previous = models.JSONField(blank=True, null=True)
+    next = models.JSONField(blank=True, null=True)
+    related = models.JSONField(default=list, blank=True)
+    is_stale = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'Navigation for {self.article_id}'
@@ -0,0 +1,181 @@
+"""
+Precomputed navigation for the article detail page.
+
+Each published article has an ArticleNavigation row holding its previous and
+next articles and its top related articles (same category, most shared tags
+first, then most recent). Rows are rebuilt when an article is published,
+edited, archived or deleted: the article itself and its old and new
+neighbours eagerly, the rest of its category lazily by flagging them stale.
+article_detail reads everything through get_navigation(), which is a single
+cache read when warm and a single row lookup when cold.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils.dateparse import parse_datetime
+
+from .caching import bump_version, get_version
+from .models import Article, ArticleNavigation
+
+NAVIGATION_KEY = 'news:navigation:{}:{}'
+RELATED_LIMIT = 5
+
+
+class NavLink:
+    """A linked article as stored in the navigation row"""
+
+    def __init__(self, data):
+        self.id = data['id']
+        self.slug = data['slug']
+        self.title = data['title']
+        self.published_at = parse_datetime(data['published_at']) if data.get('published_at') else None
+        self.views = data.get('views', 0)
+
+
+class Navigation:
+    def __init__(self, row=None):
+        self.previous = NavLink(row.previous) if row and row.previous else None
+        self.next = NavLink(row.next) if row and row.next else None
+        self.related = [NavLink(link) for link in row.related] if row else []
+
+
+def _link(article):
+    if article is None:
+        return None
+    return {
+        'id': article.pk,
+        'slug': article.slug,
+        'title': article.title,
+        'published_at': article.published_at.isoformat() if article.published_at else None,
+        'views': article.views,
+    }
+
+
+def _version_name(category_id):
+    return f'navigation:{category_id}'
+
+
+def _cache_key(article_id, category_id):
+    return NAVIGATION_KEY.format(article_id, get_version(_version_name(category_id)))
+
+
+def build_navigation(article):
+    """Compute and store the navigation row for one published article"""
+    published = Article.objects.filter(status='published').only(
+        'pk', 'slug', 'title', 'published_at', 'views'
+    )
+    stamp = article.published_at
+    previous = published.filter(
+        Q(published_at__lt=stamp) | Q(published_at=stamp, pk__lt=article.pk)
+    ).order_by('-published_at', '-pk').first()
+    following = published.filter(
+        Q(published_at__gt=stamp) | Q(published_at=stamp, pk__gt=article.pk)
+    ).order_by('published_at', 'pk').first()
+
+    tag_ids = list(article.tags.values_list('pk', flat=True))
+    related = published.filter(category_id=article.category_id).exclude(pk=article.pk)
+    if tag_ids:
+        related = related.annotate(
+            shared_tags=Count('tags', filter=Q(tags__id__in=tag_ids))
+        ).order_by('-shared_tags', '-published_at', '-pk')
+    else:
+        related = related.order_by('-published_at', '-pk')
+
+    row, _ = ArticleNavigation.objects.update_or_create(
+        article=article,
+        defaults={
+            'category_id': article.category_id,
+            'previous': _link(previous),
+            'next': _link(following),
+            'related': [_link(a) for a in related[:RELATED_LIMIT]],
+            'is_stale': False,
+        },
+    )
+    cache.delete(_cache_key(article.pk, article.category_id))
+    return row
+
+
+def get_navigation(article):
+    """Previous/next/related links for a published article, built on first use"""
+    if article.published_at is None:
+        return Navigation()
+    key = _cache_key(article.pk, article.category_id)
+    row = cache.get(key)
+    if row is None:
+        row = ArticleNavigation.objects.filter(article=article, is_stale=False).first()
+        if row is None:
+            row = build_navigation(article)
+        cache.set(key, row, getattr(settings, 'NEWS_NAVIGATION_CACHE_TIMEOUT', 3600))
+    return Navigation(row)
+
+
+def mark_categories_stale(category_ids, exclude=()):
+    """Flag every navigation row in the categories for a lazy rebuild"""
+    category_ids = {pk for pk in category_ids if pk is not None}
+    if not category_ids:
+        return
+    ArticleNavigation.objects.filter(
+        category_id__in=category_ids
+    ).exclude(article_id__in=list(exclude)).update(is_stale=True)
+    bump_version(*(_version_name(pk) for pk in category_ids))
+
+
+def _neighbour_ids(row):
+    return {link['id'] for link in (row.previous, row.next) if link}
+
+
+def navigation_snapshot(article_id):
+    """
+    The parts of an article's current navigation row that update_navigation
+    needs after a change (its neighbours and category), in a form that can be
+    passed to a task. None when the article has no row.
+    """
+    row = ArticleNavigation.objects.filter(article_id=article_id).first()
+    if row is None:
+        return None
+    return {'neighbours': sorted(_neighbour_ids(row)), 'category_id': row.category_id}
+
+
+def update_navigation(article_id, old=None):
+    """
+    Incrementally rebuild navigation after an article was saved or deleted.
+
+    `old` is the navigation_snapshot() taken before the change, which tells
+    us the article's old neighbours and old category.
+    """
+    article = Article.objects.filter(pk=article_id).first()
+    published = article is not None and article.status == 'published' and article.published_at
+    if old is None and not published:
+        # A draft that was never listed touches nobody's navigation
+        return
+
+    affected = set()
+    categories = set()
+    if old is not None:
+        affected.update(old['neighbours'])
+        categories.add(old['category_id'])
+
+    rebuilt = {article_id}
+    if published:
+        row = build_navigation(article)
+        affected |= _neighbour_ids(row)
+        categories.add(article.category_id)
+    else:
+        ArticleNavigation.objects.filter(article_id=article_id).delete()
+
+    affected.discard(article_id)
+    for neighbour in Article.objects.filter(pk__in=affected, status='published'):
+        build_navigation(neighbour)
+        rebuilt.add(neighbour.pk)
+
+    mark_categories_stale(categories, exclude=rebuilt)
+
+
+def rebuild_all_navigation():
+    """Rebuild the navigation of every published article; returns the number built"""
+    ArticleNavigation.objects.exclude(article__status='published').delete()
+    built = 0
+    for article in Article.objects.filter(status='published', published_at__isnull=False).iterator():
+        build_navigation(article)
+        built += 1
+    return built
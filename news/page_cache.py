@@ -0,0 +1,152 @@
+"""
+Full-page cache for anonymous GET requests.
+
+Entries are stamped with the content version from news.caching. A published or
+edited article moves that version, which makes every cached page stale at once.
+A stale page is regenerated by the first request that grabs the rebuild lock
+while everyone else keeps getting the stale copy, so an invalidation or an
+expiry never sends a burst of identical renders to the database.
+
+cache_public_page wraps sync and async views alike; for a coroutine view the
+cache lookups run in the sync thread and the view itself is awaited.
+"""
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .caching import CONTENT, get_version
+
+PAGE_KEY = 'news:page:{}?{}'
+LOCK_KEY = 'news:page-lock:{}?{}'
+DEFAULT_PARAMS = ('q', 'category', 'page', 'cursor')
+
+
+def normalize_query(request, params):
+    """Keep only the parameters that change the page, in a stable order"""
+    parts = []
+    for name in sorted(params):
+        value = request.GET.get(name, '').strip()
+        if name == 'page' and value in ('', '1'):
+            continue
+        if value:
+            parts.append(f'{name}={value}')
+    return '&'.join(parts)
+
+
+def is_cacheable_request(request):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if request.user.is_authenticated:
+        return False
+    # Flash messages are per visitor and must be consumed by a real render
+    if 'messages' in request.COOKIES:
+        return False
+    return True
+
+
+def is_cacheable_response(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        # A page carrying a CSRF token is tied to one visitor
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+
+def _serve(entry, state):
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    response['X-Page-Cache'] = state
+    patch_vary_headers(response, ('Cookie',))
+    return response
+
+
+def _lookup(request, params):
+    """
+    Return (plan, response): a cached response to serve as is, or the plan for
+    rendering and storing a fresh one. A plan of None means "do not cache".
+    """
+    if not is_cacheable_request(request):
+        return None, None
+
+    query = normalize_query(request, params)
+    plan = {
+        'key': PAGE_KEY.format(request.path, query),
+        'lock': None,
+        'version': get_version(CONTENT),
+    }
+    entry = cache.get(plan['key'])
+    if entry is not None:
+        fresh = entry['version'] == plan['version'] and entry['expires'] > time.time()
+        if fresh:
+            return plan, _serve(entry, 'HIT')
+        lock_timeout = getattr(settings, 'NEWS_PAGE_CACHE_LOCK_TIMEOUT', 30)
+        plan['lock'] = LOCK_KEY.format(request.path, query)
+        if not cache.add(plan['lock'], 1, lock_timeout):
+            # Somebody else is already rebuilding this page
+            return plan, _serve(entry, 'STALE')
+    return plan, None
+
+
+def _store(request, response, plan):
+    if hasattr(response, 'render') and callable(response.render):
+        response = response.render()
+    if is_cacheable_response(request, response):
+        timeout = getattr(settings, 'NEWS_PAGE_CACHE_TIMEOUT', 300)
+        grace = getattr(settings, 'NEWS_PAGE_CACHE_STALE_TIMEOUT', 3600)
+        cache.set(plan['key'], {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'version': plan['version'],
+            'expires': time.time() + timeout,
+        }, timeout + grace)
+        response['X-Page-Cache'] = 'MISS'
+        patch_vary_headers(response, ('Cookie',))
+    return response
+
+
+def _release(plan):
+    if plan['lock']:
+        cache.delete(plan['lock'])
+
+
+def cache_public_page(params=DEFAULT_PARAMS):
+    """Cache a view's HTML for anonymous visitors, keyed on path and params"""
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                plan, cached = await sync_to_async(_lookup)(request, params)
+                if cached is not None:
+                    return cached
+                if plan is None:
+                    return await view_func(request, *args, **kwargs)
+                try:
+                    response = await view_func(request, *args, **kwargs)
+                    return await sync_to_async(_store)(request, response, plan)
+                finally:
+                    await sync_to_async(_release)(plan)
+
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            plan, cached = _lookup(request, params)
+            if cached is not None:
+                return cached
+            if plan is None:
+                return view_func(request, *args, **kwargs)
+            try:
+                return _store(request, view_func(request, *args, **kwargs), plan)
+            finally:
+                _release(plan)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,230 @@
+"""
+Keyset (seek) pagination for the list views.
+
+Django's Paginator runs COUNT(*) plus an OFFSET query, and both get slower the
+deeper the page. KeysetPaginator instead remembers the sort key of the last row
+it showed and asks for rows after it, which uses the ordering index and costs
+the same on page 500 as on page 1. The page-number UI is kept alive with a
+count that is cached for a few minutes rather than recomputed per request.
+"""
+import base64
+import hashlib
+import json
+import math
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator
+from django.db.models import Q
+
+COUNT_KEY = 'news:count:{}'
+
+
+def _encode_cursor(data):
+    raw = json.dumps(data, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get('d') not in ('next', 'prev', 'last'):
+        return None
+    return data
+
+
+def cached_count(queryset, timeout=None):
+    """COUNT(*) for a queryset, reused for `timeout` seconds (0 counts every time)"""
+    if timeout is None:
+        timeout = getattr(settings, 'NEWS_PAGINATION_COUNT_TIMEOUT', 300)
+    if not timeout:
+        return queryset.count()
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.md5(f'{sql}{params}'.encode(), usedforsecurity=False).hexdigest()
+    return cache.get_or_set(COUNT_KEY.format(digest), queryset.count, timeout)
+
+
+class KeysetPage(Sequence):
+    def __init__(self, object_list, number, paginator, has_previous, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __repr__(self):
+        return f'<Page {self.number} (keyset)>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_previous or self._has_next
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return max(1, self.number - 1)
+
+    def _cursor_query(self, direction, row, number):
+        values = self.paginator.key_values(row)
+        return 'cursor=' + _encode_cursor({'d': direction, 'k': values, 'n': number})
+
+    @property
+    def first_query(self):
+        return 'cursor='
+
+    @property
+    def previous_query(self):
+        if not self.object_list:
+            return self.first_query
+        return self._cursor_query('prev', self.object_list[0], self.number - 1)
+
+    @property
+    def next_query(self):
+        return self._cursor_query('next', self.object_list[-1], self.number + 1)
+
+    @property
+    def last_query(self):
+        return 'cursor=' + _encode_cursor({'d': 'last', 'k': [], 'n': self.paginator.num_pages})
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by seeking on its sort key.
+
+    `ordering` must end in a unique column, e.g. ('-published_at', '-id'), so
+    that every row has a distinct position.
+    """
+
+    def __init__(self, object_list, per_page, ordering, count_timeout=None):
+        self.object_list = object_list.order_by(*ordering)
+        self.per_page = int(per_page)
+        self.ordering = ordering
+        self.fields = [field.lstrip('-') for field in ordering]
+        self.count_timeout = count_timeout
+
+    @property
+    def count(self):
+        """Approximate total, cached between requests"""
+        if not hasattr(self, '_count'):
+            self._count = cached_count(self.object_list, self.count_timeout)
+        return self._count
+
+    @property
+    def num_pages(self):
+        return max(1, math.ceil(self.count / self.per_page))
+
+    def key_values(self, obj):
+        values = []
+        for field in self.fields:
+            value = getattr(obj, field)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return values
+
+    def _parse_key(self, values):
+        """The cursor's key values as Python values, or None if any is unusable"""
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            return None
+        model = self.object_list.model
+        try:
+            parsed = [model._meta.get_field(field).to_python(value) for field, value in zip(self.fields, values)]
+        except (ValidationError, TypeError, ValueError):
+            return None
+        return None if None in parsed else parsed
+
+    def _seek(self, values, forward):
+        """Q object selecting rows strictly after (forward) or before the key"""
+        condition = Q()
+        for position in range(len(self.fields) - 1, -1, -1):
+            field = self.fields[position]
+            descending = self.ordering[position].startswith('-')
+            lookup = 'lt' if descending == forward else 'gt'
+            step = Q(**{f'{field}__{lookup}': values[position]})
+            if position < len(self.fields) - 1:
+                step |= Q(**{field: values[position]}) & condition
+            condition = step
+        return condition
+
+    def _reversed_ordering(self):
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+
+    def get_page(self, cursor=None):
+        """Return the page identified by a cursor string, the first page if it is missing or invalid"""
+        data = _decode_cursor(cursor) if cursor else None
+        if data is not None and data['d'] != 'last':
+            data['k'] = self._parse_key(data.get('k'))
+            if data['k'] is None:
+                data = None
+        size = self.per_page
+
+        if data is None:
+            rows = list(self.object_list[:size + 1])
+            return KeysetPage(rows[:size], 1, self, False, len(rows) > size)
+
+        number = data.get('n') if isinstance(data.get('n'), int) else 1
+        number = max(1, number)
+        if data['d'] == 'next':
+            rows = list(self.object_list.filter(self._seek(data['k'], forward=True))[:size + 1])
+            return KeysetPage(rows[:size], number, self, True, len(rows) > size)
+
+        if data['d'] == 'prev':
+            queryset = self.object_list.filter(self._seek(data['k'], forward=False))
+        else:
+            queryset = self.object_list
+        rows = list(queryset.order_by(*self._reversed_ordering())[:size + 1])
+        has_previous = len(rows) > size
+        rows = list(reversed(rows[:size]))
+        if not has_previous:
+            number = 1
+        return KeysetPage(rows, number, self, has_previous, data['d'] == 'prev')
+
+
+class OffsetPage(Page):
+    """Django's Page with the query-string helpers the list templates use"""
+
+    @property
+    def first_query(self):
+        return 'page=1'
+
+    @property
+    def previous_query(self):
+        return f'page={self.previous_page_number()}'
+
+    @property
+    def next_query(self):
+        return f'page={self.next_page_number()}'
+
+    @property
+    def last_query(self):
+        return f'page={self.paginator.num_pages}'
+
+
+class OffsetPaginator(Paginator):
+    def _get_page(self, *args, **kwargs):
+        return OffsetPage(*args, **kwargs)
+
+
+def paginate(request, queryset, per_page, ordering=None):
+    """
+    Paginate a list view: keyset pagination on `ordering` when given, page
+    numbers otherwise (e.g. for relevance-ranked search results).
+    """
+    if ordering:
+        return KeysetPaginator(queryset, per_page, ordering).get_page(request.GET.get('cursor'))
+    return OffsetPaginator(queryset, per_page).get_page(request.GET.get('page'))
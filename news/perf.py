@@ -0,0 +1,229 @@
+"""
+Request-level performance accounting.
+
+PerformanceMiddleware times every request and, through a database execute
+wrapper and a timed template backend, attributes SQL count/time, template
+render time and response size to the resolved URL name. Each response gets a
+Server-Timing header, and every view keeps a rolling window of samples from
+which percentiles are computed on demand. Statements that run more than once
+in a single request are grouped by fingerprint, which is usually an N+1.
+
+The figures are per process; staff can read them from the perf_stats view.
+State for the current request lives in a ContextVar, so it follows async
+views into the sync threads their ORM calls run in.
+"""
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template as DjangoTemplate
+
+_current = ContextVar('news_request_metrics', default=None)
+
+FINGERPRINT_RES = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'\((?:\s*(?:\?|%s)\s*,)+\s*(?:\?|%s)\s*\)'), '(...)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+
+def fingerprint(sql):
+    """SQL with literals and IN-lists collapsed, so repeated shapes compare equal"""
+    for pattern, replacement in FINGERPRINT_RES:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class RequestMetrics:
+    __slots__ = ('sql_count', 'sql_time', 'template_time', 'statements')
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.statements = Counter()
+
+
+class ViewStats:
+    """Rolling samples for one URL name"""
+
+    def __init__(self, window):
+        self.requests = 0
+        self.samples = {
+            metric: deque(maxlen=window)
+            for metric in ('latency_ms', 'sql_count', 'sql_ms', 'template_ms', 'bytes')
+        }
+        self.repeated = Counter()
+
+    def add(self, sample, repeated):
+        self.requests += 1
+        for metric, value in sample.items():
+            self.samples[metric].append(value)
+        self.repeated.update(repeated)
+
+    def summary(self, top):
+        data = {'requests': self.requests}
+        for metric, values in self.samples.items():
+            ordered = sorted(values)
+            data[metric] = {
+                'p50': percentile(ordered, 50),
+                'p95': percentile(ordered, 95),
+                'p99': percentile(ordered, 99),
+                'max': ordered[-1] if ordered else 0,
+            }
+        data['repeated_queries'] = [
+            {'sql': sql, 'count': count} for sql, count in self.repeated.most_common(top)
+        ]
+        return data
+
+
+def percentile(ordered, pct):
+    if not ordered:
+        return 0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 2)
+
+
+class PerfRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view_name, sample, repeated):
+        window = getattr(settings, 'NEWS_PERF_WINDOW', 500)
+        with self._lock:
+            stats = self._views.get(view_name)
+            if stats is None:
+                stats = self._views[view_name] = ViewStats(window)
+            stats.add(sample, repeated)
+
+    def report(self, limit=10, top_queries=5):
+        """The slowest views by p95 latency, with their repeated-query fingerprints"""
+        with self._lock:
+            summaries = {name: stats.summary(top_queries) for name, stats in self._views.items()}
+        ranked = sorted(summaries.items(), key=lambda item: item[1]['latency_ms']['p95'], reverse=True)
+        return [{'view': name, **summary} for name, summary in ranked[:limit]]
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = PerfRegistry()
+
+
+def record_sql(execute, sql, params, many, context):
+    """Execute wrapper installed on every connection; idle outside a measured request"""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql_time += time.perf_counter() - started
+        metrics.sql_count += 1
+        metrics.statements[fingerprint(sql)] += 1
+
+
+def install_execute_wrapper(sender=None, connection=None, **kwargs):
+    # Outermost, so connection.execute_wrapper() blocks that pop() theirs leave it alone
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_sql)
+
+
+connection_created.connect(install_execute_wrapper)
+
+
+class TimedTemplate(DjangoTemplate):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, timing each top-level render for PerformanceMiddleware"""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+class PerformanceMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'NEWS_PERF_ENABLED', True)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+        token, started = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics = _current.get()
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+        token, started = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics = _current.get()
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    def _start(self):
+        # Connections opened before this module was imported missed connection_created
+        for connection in connections.all(initialized_only=True):
+            install_execute_wrapper(connection=connection)
+        return _current.set(RequestMetrics()), time.perf_counter()
+
+    def _finish(self, request, response, metrics, started):
+        latency = (time.perf_counter() - started) * 1000
+        match = getattr(request, 'resolver_match', None)
+        view_name = (match.view_name if match else None) or 'unresolved'
+        size = len(response.content) if not response.streaming else 0
+        sample = {
+            'latency_ms': latency,
+            'sql_count': metrics.sql_count,
+            'sql_ms': metrics.sql_time * 1000,
+            'template_ms': metrics.template_time * 1000,
+            'bytes': size,
+        }
+        repeated = {sql: count for sql, count in metrics.statements.items() if count > 1}
+        registry.record(view_name, sample, repeated)
+
+        if getattr(settings, 'NEWS_PERF_SERVER_TIMING', True):
+            response['Server-Timing'] = (
+                f'db;dur={sample["sql_ms"]:.1f};desc="{metrics.sql_count} queries", '
+                f'tpl;dur={sample["template_ms"]:.1f}, '
+                f'total;dur={latency:.1f}'
+            )
+        return response
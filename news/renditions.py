@@ -0,0 +1,99 @@
+"""
+Resized WebP/JPEG copies of Article.featured_image.
+
+Editors upload full-size phone photos; pages should never send those. When an
+article's image changes, news.tasks calls generate_renditions(), which writes
+one WebP and one JPEG per configured width under renditions/, named after a
+hash of the source bytes. The names change whenever the image does, so the
+files can be cached forever and identical uploads share them. The result is
+recorded in Article.image_renditions, and the {% article_image %} tag turns
+it into a <picture> with srcset without touching the filesystem.
+"""
+import hashlib
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from .caching import CONTENT, bump_version
+from .models import Article
+
+RENDITION_PATH = 'renditions/{}/{}-{}.{}'
+# (Pillow format, file extension, save options)
+FORMATS = (
+    ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+
+
+def rendition_widths():
+    return sorted(getattr(settings, 'NEWS_RENDITION_WIDTHS', (320, 640, 960, 1280)))
+
+
+def target_widths(original_width):
+    """The configured widths below the original, plus the original if it is smaller than the largest"""
+    configured = rendition_widths()
+    widths = [width for width in configured if width < original_width]
+    if original_width <= configured[-1]:
+        widths.append(original_width)
+    return widths
+
+
+def build_renditions(image_file, storage=default_storage, force=False):
+    """Write every rendition of an image file and return its manifest"""
+    with image_file.open('rb') as fh:
+        data = fh.read()
+    digest = hashlib.sha256(data).hexdigest()[:20]
+
+    with Image.open(BytesIO(data)) as image:
+        # Let the JPEG decoder downscale while decoding; far cheaper on big photos
+        largest = rendition_widths()[-1]
+        image.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        original_width, original_height = image.size
+
+        manifest = {
+            'source': image_file.name,
+            'hash': digest,
+            'width': original_width,
+            'height': original_height,
+        }
+        for width in target_widths(original_width):
+            height = max(1, round(original_height * width / original_width))
+            resized = image if width == original_width else image.resize(
+                (width, height), Image.Resampling.LANCZOS
+            )
+            for fmt, ext, options in FORMATS:
+                name = RENDITION_PATH.format(digest[:2], digest, width, ext)
+                if storage.exists(name):
+                    if not force:
+                        manifest.setdefault(ext, []).append([width, name])
+                        continue
+                    storage.delete(name)
+                buffer = BytesIO()
+                resized.save(buffer, fmt, **options)
+                storage.save(name, ContentFile(buffer.getvalue()))
+                manifest.setdefault(ext, []).append([width, name])
+    return manifest
+
+
+def needs_renditions(article):
+    """True when the stored manifest does not describe the current featured_image"""
+    current = article.featured_image.name if article.featured_image else None
+    return (article.image_renditions or {}).get('source') != current
+
+
+def generate_renditions(article, force=False):
+    """Bring an article's renditions up to date and store the manifest"""
+    if not force and not needs_renditions(article):
+        return article.image_renditions
+    manifest = build_renditions(article.featured_image, force=force) if article.featured_image else {}
+    # A queryset update keeps the post_save pipeline from firing again
+    Article.objects.filter(pk=article.pk).update(image_renditions=manifest)
+    article.image_renditions = manifest
+    bump_version(CONTENT)
+    return manifest
@@ -0,0 +1,193 @@
+import re
+
+from django.db import connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from .models import Article
+
+SEARCH_FIELDS = ('title', 'excerpt', 'content')
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_terms(query):
+    """Split free-text input into plain word tokens safe to pass to MATCH/to_tsquery"""
+    return TOKEN_RE.findall(query or '')[:16]
+
+
+class BaseSearchBackend:
+    """Interface shared by the full-text search backends"""
+
+    def __init__(self, using='default'):
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def index_article(self, article):
+        raise NotImplementedError
+
+    def remove_article(self, article_id):
+        raise NotImplementedError
+
+    def remove_articles(self, article_ids):
+        for article_id in article_ids:
+            self.remove_article(article_id)
+
+    def rebuild(self):
+        """Re-index every article; returns the number of indexed rows"""
+        raise NotImplementedError
+
+    def search(self, queryset, query):
+        """Filter an Article queryset to the matches for query, best matches first"""
+        raise NotImplementedError
+
+
+class LikeSearchBackend(BaseSearchBackend):
+    """Unindexed icontains search for databases without a full-text engine"""
+
+    def index_article(self, article):
+        pass
+
+    def remove_article(self, article_id):
+        pass
+
+    def remove_articles(self, article_ids):
+        pass
+
+    def rebuild(self):
+        return 0
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(content__icontains=query) |
+            Q(excerpt__icontains=query)
+        )
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+    """Search through the news_article_fts FTS5 table, ranked with bm25()"""
+
+    table = 'news_article_fts'
+    # bm25 column weights for title, excerpt, content
+    weights = (10.0, 5.0, 1.0)
+
+    def index_article(self, article):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [article.pk])
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, excerpt, body) VALUES (%s, %s, %s, %s)',
+                [article.pk, article.title, article.excerpt, article.content],
+            )
+
+    def remove_article(self, article_id):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [article_id])
+
+    def remove_articles(self, article_ids):
+        placeholders = ', '.join(['%s'] * len(article_ids))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid IN ({placeholders})', list(article_ids))
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, excerpt, body) '
+                f'SELECT id, title, excerpt, content FROM {Article._meta.db_table}'
+            )
+            return cursor.rowcount
+
+    def search(self, queryset, query):
+        terms = search_terms(query)
+        if not terms:
+            return queryset.none()
+        match = ' AND '.join(f'"{term}"*' for term in terms)
+        article_table = Article._meta.db_table
+        matches = RawSQL(f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s', (match,))
+        rank = RawSQL(
+            f'SELECT bm25({self.table}, %s, %s, %s) FROM {self.table} '
+            f'WHERE {self.table} MATCH %s AND {self.table}.rowid = {article_table}.id',
+            (*self.weights, match),
+            output_field=FloatField(),
+        )
+        # bm25() scores are negative, lower is a better match
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank).order_by('search_rank', '-pk')
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Search through a GIN-indexed tsvector table, ranked with ts_rank()"""
+
+    table = 'news_article_search'
+    config = 'english'
+
+    def _document_sql(self):
+        return (
+            f"setweight(to_tsvector('{self.config}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(excerpt, '')), 'B') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(content, '')), 'C')"
+        )
+
+    def index_article(self, article):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {self.table} (article_id, document) '
+                f'SELECT id, {self._document_sql()} FROM {Article._meta.db_table} WHERE id = %s '
+                f'ON CONFLICT (article_id) DO UPDATE SET document = EXCLUDED.document',
+                [article.pk],
+            )
+
+    def remove_article(self, article_id):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE article_id = %s', [article_id])
+
+    def remove_articles(self, article_ids):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE article_id = ANY(%s)', [list(article_ids)])
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (article_id, document) '
+                f'SELECT id, {self._document_sql()} FROM {Article._meta.db_table}'
+            )
+            return cursor.rowcount
+
+    def search(self, queryset, query):
+        terms = search_terms(query)
+        if not terms:
+            return queryset.none()
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        article_table = Article._meta.db_table
+        matches = RawSQL(
+            f"SELECT article_id FROM {self.table} "
+            f"WHERE document @@ to_tsquery('{self.config}', %s)",
+            (tsquery,),
+        )
+        rank = RawSQL(
+            f"SELECT ts_rank(document, to_tsquery('{self.config}', %s)) FROM {self.table} "
+            f"WHERE article_id = {article_table}.id",
+            (tsquery,),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank).order_by('-search_rank', '-pk')
+
+
+BACKENDS = {
+    'sqlite': SQLiteFTS5Backend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend(using='default'):
+    """Pick the search backend matching the database vendor"""
+    backend_class = BACKENDS.get(connections[using].vendor, LikeSearchBackend)
+    return backend_class(using)
+
+
+def search_articles(queryset, query):
+    """Ranked full-text search over an Article queryset"""
+    return get_search_backend(queryset.db).search(queryset, query)
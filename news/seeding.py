@@ -0,0 +1,172 @@
+"""
+Deterministic bulk data generation for profiling and load tests.
+
+Rows are produced by generators and written with bulk_create in fixed-size
+batches, so memory stays flat whether we seed a thousand articles or a
+hundred thousand. Likes go straight into the likes through table, and the
+like_count/comment_count columns are filled in from the same numbers, so the
+counters are consistent without a reconciliation pass. The same seed always
+gives the same dataset.
+"""
+import random
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import CONTENT, STATS, bump_version
+from .models import Article, Category, Comment
+from .search import get_search_backend
+from .stats import invalidate_site_stats
+
+WORDS = (
+    'campus library student faculty research exam semester club team league lecture '
+    'science robotics music theatre festival award grant scholarship council election '
+    'health wellness career alumni startup lab engineering art history debate volunteer '
+    'garden climate energy budget housing dining transit sports final season coach record'
+).split()
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class DatasetSeeder:
+    """
+    Generate users, categories, articles, comments and likes.
+
+    `likes` and `comments` are totals across all articles; each article gets a
+    skewed share, like real traffic where a few stories draw most readers.
+    """
+
+    def __init__(self, users=100, categories=8, articles=1000, comments=5000, likes=20000,
+                 seed=1, prefix='seed', batch_size=2000, published_ratio=0.85, log=None):
+        self.counts = {
+            'users': users, 'categories': categories, 'articles': articles,
+            'comments': comments, 'likes': likes,
+        }
+        # Separate streams keep the data independent of the batch size, which
+        # decides how article and engagement generation interleave
+        self.rng = random.Random(seed)
+        self.engagement_rng = random.Random(f'{seed}-engagement')
+        self.prefix = f'{prefix}{seed}'
+        self.batch_size = batch_size
+        self.published_ratio = published_ratio
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+
+    def _words(self, low, high, rng=None):
+        rng = rng or self.rng
+        return ' '.join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+    def _share(self, total, slots):
+        """An exponential share of `total` for one of `slots` items"""
+        if not total or not slots:
+            return 0
+        return int(self.engagement_rng.expovariate(slots / total))
+
+    def exists(self):
+        return User.objects.filter(username__startswith=f'{self.prefix}-').exists()
+
+    def generate_users(self):
+        password = make_password(f'{self.prefix}-password')
+        for n in range(self.counts['users']):
+            yield User(
+                username=f'{self.prefix}-user{n}',
+                email=f'{self.prefix}-user{n}@example.com',
+                password=password,
+                is_staff=n < max(1, self.counts['users'] // 50),
+            )
+
+    def generate_categories(self):
+        for n in range(self.counts['categories']):
+            yield Category(name=f'{self.prefix} {self._words(1, 2).title()} {n}', description=self._words(5, 12))
+
+    def generate_articles(self, author_ids, category_ids):
+        for n in range(self.counts['articles']):
+            published = self.rng.random() < self.published_ratio
+            title = self._words(4, 9).capitalize()
+            yield Article(
+                title=title,
+                slug=f'{self.prefix}-{n}',
+                content='\n\n'.join(self._words(40, 120) for _ in range(self.rng.randint(2, 6))),
+                excerpt=self._words(15, 30),
+                author_id=self.rng.choice(author_ids),
+                category_id=self.rng.choice(category_ids),
+                status='published' if published else self.rng.choice(('draft', 'archived')),
+                published_at=self.now - timedelta(minutes=self.rng.randint(0, 2 * 365 * 24 * 60)) if published else None,
+                views=int(self.rng.paretovariate(1.2) * 10),
+            )
+
+    def _insert(self, objects, label):
+        created = 0
+        for batch in batched(objects, self.batch_size):
+            with transaction.atomic():
+                type(batch[0]).objects.bulk_create(batch)
+            created += len(batch)
+            self.log(f'{label}: {created}')
+        return created
+
+    def seed(self):
+        """Write the whole dataset; returns the number of rows created per model"""
+        created = {}
+        created['users'] = self._insert(self.generate_users(), 'users')
+        user_ids = list(User.objects.filter(
+            username__startswith=f'{self.prefix}-'
+        ).order_by('pk').values_list('pk', flat=True))
+        author_ids = list(User.objects.filter(
+            pk__in=user_ids, is_staff=True
+        ).values_list('pk', flat=True)) or user_ids[:1]
+
+        created['categories'] = self._insert(self.generate_categories(), 'categories')
+        category_ids = list(Category.objects.filter(
+            name__startswith=f'{self.prefix} '
+        ).values_list('pk', flat=True))
+
+        created.update(articles=0, comments=0, likes=0)
+        for batch in batched(self.generate_articles(author_ids, category_ids), self.batch_size):
+            self._fill_batch(batch, user_ids, created)
+            self.log(f"articles: {created['articles']}, comments: {created['comments']}, likes: {created['likes']}")
+
+        # bulk_create skips the signals that keep derived data current
+        get_search_backend().rebuild()
+        invalidate_site_stats()
+        bump_version(CONTENT, STATS)
+        return created
+
+    def _fill_batch(self, articles, user_ids, created):
+        """Insert one batch of articles with their comments and likes"""
+        per_article = self.counts['articles']
+        rng = self.engagement_rng
+        likes, comments = [], []
+        for article in articles:
+            like_total = min(len(user_ids), self._share(self.counts['likes'], per_article))
+            comment_total = self._share(self.counts['comments'], per_article)
+            article.like_count = like_total
+            article.comment_count = comment_total
+            article._likers = rng.sample(user_ids, like_total)
+            article._comments = [
+                (rng.choice(user_ids), self._words(5, 40, rng)) for _ in range(comment_total)
+            ]
+
+        Through = Article.likes.through
+        with transaction.atomic():
+            Article.objects.bulk_create(articles)
+            for article in articles:
+                likes.extend(Through(article_id=article.pk, user_id=user_id) for user_id in article._likers)
+                comments.extend(
+                    Comment(article_id=article.pk, author_id=user_id, content=content)
+                    for user_id, content in article._comments
+                )
+            for batch in batched(likes, self.batch_size * 5):
+                Through.objects.bulk_create(batch)
+            for batch in batched(comments, self.batch_size):
+                Comment.objects.bulk_create(batch)
+        created['articles'] += len(articles)
+        created['likes'] += len(likes)
+        created['comments'] += len(comments)
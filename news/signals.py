@@ -0,0 +1,178 @@
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.db import connections, transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .auth import user_cache
+from .analytics import invalidate_author_metrics, invalidate_authors_of
+from .caching import CONTENT, STATS, bump_version
+from .counters import refresh_comment_count, refresh_like_count
+from .models import Article, Category, Comment
+from .navigation import mark_categories_stale, navigation_snapshot
+from .search import SEARCH_FIELDS
+from .stats import invalidate_site_stats
+from .tasks import article_pipeline, enqueue
+
+
+@receiver(m2m_changed, sender=Article.likes.through)
+def update_like_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep Article.like_count in step with likes.add/remove/clear"""
+    if action == 'pre_clear' and reverse:
+        # user.liked_articles.clear() does not report which articles it touched
+        instance._cleared_article_ids = list(
+            sender.objects.filter(user_id=instance.pk).values_list('article_id', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        article_ids = [instance.pk]
+    elif action == 'post_clear':
+        article_ids = getattr(instance, '_cleared_article_ids', [])
+    else:
+        article_ids = list(pk_set or [])
+
+    if article_ids:
+        refresh_like_count(article_ids)
+        bump_version(STATS)
+        invalidate_authors_of(article_ids)
+    if not reverse:
+        instance.refresh_from_db(fields=['like_count'])
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, raw=False, **kwargs):
+    """Bump the parent article's comment_count when a comment is created"""
+    if created and not raw:
+        Article.objects.filter(pk=instance.article_id).update(comment_count=F('comment_count') + 1)
+
+
+def _flush_comment_recounts(using):
+    connection = connections[using]
+    article_ids, connection.news_comment_recounts = getattr(connection, 'news_comment_recounts', None), None
+    if article_ids:
+        refresh_comment_count(article_ids)
+        # Deleted articles are gone by now; clear_author_metrics covered their authors
+        invalidate_authors_of(article_ids)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, using='default', **kwargs):
+    """
+    Recount the parent article's comments, and invalidate its author's metrics,
+    once the deleting transaction commits. A cascade (an article or user with
+    many comments) collects every article it touched and handles them with one
+    UPDATE and one author lookup; the callbacks registered after the first find
+    nothing left to do. Ids left behind by a rolled-back
+    transaction are recounted with the next batch, which is harmless.
+    """
+    connection = connections[using]
+    if getattr(connection, 'news_comment_recounts', None) is None:
+        connection.news_comment_recounts = set()
+    connection.news_comment_recounts.add(instance.article_id)
+    transaction.on_commit(partial(_flush_comment_recounts, using), using=using)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Comment)
+def clear_site_stats(sender, **kwargs):
+    """Expire the cached site totals when the underlying rows change"""
+    invalidate_site_stats()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Comment)
+def clear_site_stats_on_create(sender, created, **kwargs):
+    """Comments and users only affect the totals when they are created"""
+    if created:
+        invalidate_site_stats()
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_content_version(sender, raw=False, **kwargs):
+    """Invalidate every cached fragment that depends on published content"""
+    if not raw:
+        bump_version(CONTENT)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    """Drop this process's cached copy so request.user reflects the change"""
+    user_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def clear_author_metrics(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_author_metrics(instance.author_id)
+
+
+@receiver(post_save, sender=Comment)
+def clear_author_metrics_for_comment(sender, instance, created, raw=False, **kwargs):
+    # Editing a comment leaves the author's comment total unchanged; deletions
+    # are batched by decrement_comment_count
+    if created and not raw:
+        invalidate_authors_of([instance.article_id])
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def refresh_related_on_tags(sender, instance, action, reverse, **kwargs):
+    """Shared tags rank the related list, so retagging stales the category"""
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, Article):
+        mark_categories_stale([instance.category_id])
+
+
+NAVIGATION_FIELDS = {'title', 'slug', 'status', 'published_at', 'category'}
+
+
+def _touches(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+@receiver(pre_save, sender=Article)
+@receiver(pre_delete, sender=Article)
+def remember_navigation(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Snapshot the pre-change navigation row so its old neighbours can be rebuilt"""
+    if not raw and instance.pk and _touches(update_fields, NAVIGATION_FIELDS):
+        instance._old_navigation = navigation_snapshot(instance.pk)
+
+
+# Connected last so the pipeline (which runs inline in eager mode) sees the
+# caches already invalidated by the receivers above
+
+@receiver(post_save, sender=Article)
+def run_article_pipeline(sender, instance, raw=False, using='default', update_fields=None, **kwargs):
+    """Queue the search index, navigation and stats refresh for a saved article"""
+    if raw:
+        return
+    pipeline = article_pipeline(
+        instance,
+        navigation=getattr(instance, '_old_navigation', None),
+        reindex=_touches(update_fields, SEARCH_FIELDS),
+        renavigate=_touches(update_fields, NAVIGATION_FIELDS),
+        using=using,
+    )
+    enqueue(pipeline, using)
+
+
+@receiver(post_delete, sender=Article)
+def run_article_removal_pipeline(sender, instance, using='default', **kwargs):
+    pipeline = article_pipeline(
+        instance, navigation=getattr(instance, '_old_navigation', None), deleted=True, using=using,
+    )
+    enqueue(pipeline, using)
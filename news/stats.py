@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from .models import Article, Category
+
+SITE_STATS_CACHE_KEY = 'news:site_stats'
+
+
+def compute_site_stats():
+    """Site-wide totals; all article figures come from a single aggregate query"""
+    published = Q(status='published')
+    stats = Article.objects.aggregate(
+        articles=Count('pk'),
+        published_articles=Count('pk', filter=published),
+        views=Coalesce(Sum('views', filter=published), 0),
+        likes=Coalesce(Sum('like_count', filter=published), 0),
+        comments=Coalesce(Sum('comment_count', filter=published), 0),
+    )
+    stats['categories'] = Category.objects.count()
+    stats['users'] = User.objects.count()
+    return stats
+
+
+def get_site_stats(cached=True):
+    """Return site totals, from the cached snapshot unless cached=False"""
+    if not cached:
+        return compute_site_stats()
+    timeout = getattr(settings, 'NEWS_STATS_CACHE_TIMEOUT', 60)
+    return cache.get_or_set(SITE_STATS_CACHE_KEY, compute_site_stats, timeout)
+
+
+def invalidate_site_stats():
+    """Drop the cached snapshot so the next read recomputes it"""
+    cache.delete(SITE_STATS_CACHE_KEY)
@@ -0,0 +1,85 @@
+"""
+Celery tasks for the derived data an article change fans out to.
+
+Saving or deleting an article only invalidates caches inline (cheap version
+bumps and key deletes, see news.signals); rebuilding what depends on it is
+queued here: the search index entry, the precomputed navigation, the
+featured image renditions and the site/author statistics. The work is sent
+once the surrounding transaction commits so workers never see uncommitted
+rows.
+
+With CELERY_TASK_ALWAYS_EAGER (the default while the broker is the in-memory
+one, and in tests) the pipeline runs inline at signal time, exactly like the
+code it replaced.
+"""
+from celery import group, shared_task
+from django.db import transaction
+
+from .analytics import get_author_metrics
+from .models import Article
+from .navigation import update_navigation
+from .renditions import generate_renditions, needs_renditions
+from .search import get_search_backend
+from .stats import get_site_stats
+
+
+@shared_task(ignore_result=True)
+def index_article(article_id, using='default'):
+    """Write the article's current text to the full-text index"""
+    backend = get_search_backend(using)
+    article = Article.objects.using(using).filter(pk=article_id).first()
+    if article is None:
+        backend.remove_article(article_id)
+    else:
+        backend.index_article(article)
+
+
+@shared_task(ignore_result=True)
+def unindex_article(article_id, using='default'):
+    get_search_backend(using).remove_article(article_id)
+
+
+@shared_task(ignore_result=True)
+def rebuild_navigation(article_id, old=None):
+    update_navigation(article_id, old)
+
+
+@shared_task(ignore_result=True)
+def render_images(article_id):
+    """Resize the article's featured image into its WebP/JPEG renditions"""
+    article = Article.objects.filter(pk=article_id).first()
+    if article is not None:
+        generate_renditions(article)
+
+
+@shared_task(ignore_result=True)
+def warm_stats(author_id=None):
+    """Recompute the site totals, and the author's metrics, right after they were invalidated"""
+    get_site_stats()
+    if author_id is not None:
+        get_author_metrics(author_id)
+
+
+def article_pipeline(article, navigation=None, reindex=True, renavigate=True, deleted=False, using='default'):
+    """The group of tasks that brings derived data up to date after an article change"""
+    tasks = []
+    if deleted:
+        tasks.append(unindex_article.si(article.pk, using))
+    elif reindex:
+        tasks.append(index_article.si(article.pk, using))
+    if renavigate:
+        tasks.append(rebuild_navigation.si(article.pk, navigation))
+    if not deleted and needs_renditions(article):
+        tasks.append(render_images.si(article.pk))
+    tasks.append(warm_stats.si(article.author_id))
+    return group(tasks)
+
+
+def enqueue(signature, using='default'):
+    """Run a task signature once the current transaction commits (inline in eager mode)"""
+    if signature.app.conf.task_always_eager:
+        # Eager tasks behave like the inline code they replace: they run now,
+        # inside the caller's transaction, and raise straight into it
+        signature.apply_async()
+    else:
+        transaction.on_commit(signature.apply_async, using=using)
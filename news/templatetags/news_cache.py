@@ -0,0 +1,49 @@
+from django import template
+
+from news.caching import CONTENT, get_or_render_fragment
+
+register = template.Library()
+
+
+class FragmentNode(template.Node):
+    def __init__(self, nodelist, name, vary_on, versions):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+        self.versions = versions
+
+    def render(self, context):
+        vary_on = [var.resolve(context) for var in self.vary_on]
+        return get_or_render_fragment(
+            self.name,
+            lambda: self.nodelist.render(context),
+            vary_on=vary_on,
+            versions=self.versions,
+        )
+
+
+@register.tag('cachefragment')
+def do_cachefragment(parser, token):
+    """
+    Cache a template fragment until one of the content versions it depends on moves.
+
+        {% cachefragment "home_popular" article.pk versions="content,stats" %}
+            ...
+        {% endcachefragment %}
+
+    Extra arguments are resolved and vary the key; versions defaults to "content".
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a fragment name.")
+    name = bits[1].strip('"\'')
+    versions = (CONTENT,)
+    vary_on = []
+    for bit in bits[2:]:
+        if bit.startswith('versions='):
+            versions = tuple(v for v in bit[len('versions='):].strip('"\'').split(',') if v)
+        else:
+            vary_on.append(parser.compile_filter(bit))
+    nodelist = parser.parse(('endcachefragment',))
+    parser.delete_first_token()
+    return FragmentNode(nodelist, name, vary_on, versions)
@@ -0,0 +1,41 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+register = template.Library()
+
+DEFAULT_WIDTH = 640
+
+
+def _srcset(renditions):
+    return ', '.join(f'{default_storage.url(name)} {width}w' for width, name in renditions)
+
+
+@register.simple_tag
+def article_image(article, sizes='100vw', **attrs):
+    """
+    Render an article's featured image as a <picture> with WebP and JPEG srcsets.
+
+        {% article_image article sizes="(min-width: 768px) 50vw, 100vw" class="card-img-top" %}
+
+    Extra keyword arguments become <img> attributes; loading defaults to "lazy".
+    Until the renditions exist the original upload is used.
+    """
+    if not article.featured_image:
+        return ''
+    attrs = {'alt': article.title, 'loading': 'lazy', 'decoding': 'async', **attrs}
+    manifest = article.image_renditions or {}
+    if manifest.get('source') != article.featured_image.name or not manifest.get('jpg'):
+        return format_html('<img src="{}"{}>', article.featured_image.url, flatatt(attrs))
+
+    jpegs = manifest['jpg']
+    width, name = next(((w, n) for w, n in jpegs if w >= DEFAULT_WIDTH), jpegs[-1])
+    attrs.setdefault('width', width)
+    attrs.setdefault('height', round(manifest['height'] * width / manifest['width']))
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}"{}></picture>',
+        _srcset(manifest.get('webp', [])), sizes,
+        default_storage.url(name), _srcset(jpegs), sizes, flatatt(attrs),
+    )
@@ -20,6 +20,7 @@ urlpatterns = [
     
     # Article management
     path('articles/', views.article_list, name='article_list'),
+    path('articles/bulk/', views.article_bulk, name='article_bulk'),
     path('articles/create/', views.article_create, name='article_create'),
     path('articles/<slug:slug>/edit/', views.article_edit, name='article_update'),  # Fixed name and parameter
     path('articles/<slug:slug>/delete/', views.article_delete, name='article_delete'),  # Fixed parameter
@@ -34,16 +35,20 @@ urlpatterns = [
     path('comments/<int:comment_id>/edit/', views.comment_edit, name='comment_update'),  # Fixed name
     path('comments/<int:comment_id>/delete/', views.comment_delete, name='comment_delete'),
     path('article/<slug:slug>/comment/', views.comment_create, name='comment_create'),  # Added missing comment creation
+    path('article/<slug:slug>/comments/', views.comment_list, name='comment_list'),
     
     # User Management (Admin only)
     path('users/', views.user_list, name='user_list'),
     path('users/<int:user_id>/', views.user_detail, name='user_detail'),
     path('users/<int:user_id>/toggle-staff/', views.user_toggle_staff, name='user_toggle_staff'),
     path('users/<int:user_id>/toggle-active/', views.user_toggle_active, name='user_toggle_active'),
+    path('users/<int:user_id>/purge-spam/', views.user_purge_spam, name='user_purge_spam'),
     path('users/<int:user_id>/delete/', views.user_delete, name='user_delete'),
     
     # Settings (Admin only)
     path('settings/', views.settings_view, name='settings'),
+    path('settings/cache-stats/', views.cache_stats, name='cache_stats'),
+    path('settings/perf-stats/', views.perf_stats, name='perf_stats'),
     
     # Profile
     path('profile/', views.profile_view, name='profile'),
@@ -0,0 +1,208 @@
+"""
+Buffered article view counting.
+
+article_detail records hits in a buffer instead of writing Article.views on
+every request. Buffered hits are flushed as atomic ``F('views') + n`` updates.
+The shared Redis buffer is flushed by the ``flush_view_counts`` management
+command (run it periodically). Each process flushes its own in-process buffer
+once per flush interval, on a background thread so no request waits for it.
+
+A flush takes the hits out of the buffer, writes them and only then lets the
+buffer forget them (commit), or hands them back if the write fails (rollback).
+"""
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+
+from .analytics import invalidate_authors_of
+from .caching import STATS, bump_version
+from .models import Article
+
+FLUSH_BATCH_SIZE = 500
+
+
+class LocalViewBuffer:
+    """Per-process buffer; each worker flushes its own pending hits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(int)
+
+    def record(self, article_id, amount=1):
+        with self._lock:
+            self._counts[article_id] += amount
+
+    def pending(self, article_id):
+        with self._lock:
+            return self._counts.get(article_id, 0)
+
+    def drain(self):
+        with self._lock:
+            counts, self._counts = dict(self._counts), defaultdict(int)
+        return counts
+
+    def commit(self):
+        pass
+
+    def rollback(self, counts):
+        for article_id, amount in counts.items():
+            self.record(article_id, amount)
+
+
+class RedisViewBuffer:
+    """
+    Buffer shared by every worker, kept in a Redis hash.
+
+    drain() renames the hash to a flushing hash, which commit() deletes only
+    after the database write has committed. A flush that dies in between
+    leaves the flushing hash (and, until it expires, the lock) behind, and the
+    next drain() writes those hits before taking new ones. Hits are therefore
+    counted at least once; a crash between the commit and the delete can
+    count a batch twice, never zero times.
+    """
+
+    lock_timeout = 300
+
+    def __init__(self, url=None, key='news:article_views', client=None):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.key = key
+        self.flushing_key = f'{key}:flushing'
+        self.lock_key = f'{key}:lock'
+        self._lock_token = None
+
+    def record(self, article_id, amount=1):
+        self.client.hincrby(self.key, article_id, amount)
+
+    def pending(self, article_id):
+        return int(self.client.hget(self.key, article_id) or 0)
+
+    def drain(self):
+        token = uuid.uuid4().hex
+        if not self.client.set(self.lock_key, token, nx=True, ex=self.lock_timeout):
+            # Another worker is flushing
+            return {}
+        self._lock_token = token
+        if not self.client.exists(self.flushing_key):
+            # Renaming means hits recorded during the flush land in a fresh hash
+            try:
+                self.client.rename(self.key, self.flushing_key)
+            except Exception:
+                if self.client.exists(self.key):
+                    self._release()
+                    raise
+        raw = self.client.hgetall(self.flushing_key)
+        if not raw:
+            self._release()
+        return {int(article_id): int(amount) for article_id, amount in raw.items()}
+
+    def commit(self):
+        self.client.delete(self.flushing_key)
+        self._release()
+
+    def rollback(self, counts):
+        # The flushing hash stays for the next drain() to retry
+        self._release()
+
+    def _release(self):
+        token, self._lock_token = self._lock_token, None
+        if token is not None and self.client.get(self.lock_key) == token.encode():
+            self.client.delete(self.lock_key)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+_last_flush = time.monotonic()
+_flush_thread = None
+
+
+def get_view_buffer():
+    """Return the configured buffer (NEWS_VIEW_COUNTER_BACKEND: 'local' or 'redis')"""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                backend = getattr(settings, 'NEWS_VIEW_COUNTER_BACKEND', 'local')
+                if backend == 'redis':
+                    _buffer = RedisViewBuffer(settings.NEWS_VIEW_COUNTER_REDIS_URL)
+                else:
+                    _buffer = LocalViewBuffer()
+    return _buffer
+
+
+def reset_view_buffer():
+    """Forget the current buffer so the next call re-reads settings"""
+    global _buffer
+    _buffer = None
+
+
+def _flush_in_background():
+    try:
+        flush_view_counts()
+    finally:
+        # This thread's connections are never reused; don't leave them open
+        connections.close_all()
+
+
+def _start_background_flush():
+    global _flush_thread, _last_flush
+    with _buffer_lock:
+        if _flush_thread is not None and _flush_thread.is_alive():
+            return
+        _last_flush = time.monotonic()
+        _flush_thread = threading.Thread(target=_flush_in_background, name='news-view-flush', daemon=True)
+        _flush_thread.start()
+
+
+def record_view(article_id):
+    """Count one hit on an article without touching the database"""
+    buffer = get_view_buffer()
+    buffer.record(article_id)
+    if isinstance(buffer, LocalViewBuffer):
+        interval = getattr(settings, 'NEWS_VIEW_COUNTER_FLUSH_INTERVAL', 30)
+        if time.monotonic() - _last_flush >= interval:
+            _start_background_flush()
+
+
+def pending_views(article_id):
+    """Hits recorded for an article that have not been written yet"""
+    return get_view_buffer().pending(article_id)
+
+
+def flush_view_counts():
+    """Write buffered hits to Article.views; returns the number of articles updated"""
+    global _last_flush
+    _last_flush = time.monotonic()
+    buffer = get_view_buffer()
+    counts = buffer.drain()
+    if not counts:
+        return 0
+
+    # One UPDATE per distinct increment keeps the statement count small
+    by_amount = defaultdict(list)
+    for article_id, amount in counts.items():
+        by_amount[amount].append(article_id)
+
+    try:
+        with transaction.atomic():
+            for amount, article_ids in by_amount.items():
+                for start in range(0, len(article_ids), FLUSH_BATCH_SIZE):
+                    Article.objects.filter(
+                        pk__in=article_ids[start:start + FLUSH_BATCH_SIZE]
+                    ).update(views=F('views') + amount)
+    except Exception:
+        buffer.rollback(counts)
+        raise
+    # Inside an outer transaction the buffer may only forget the hits once it commits
+    transaction.on_commit(buffer.commit)
+    bump_version(STATS)
+    invalidate_authors_of(counts)
+    return len(counts)
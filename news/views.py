@@ -1,49 +1,88 @@
-from django.shortcuts import render, get_object_or_404, redirect
+import asyncio
+import os
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.shortcuts import render, get_object_or_404, redirect, aget_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.text import slugify
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserChangeForm
 from .models import Article, Category, Comment
+from .analytics import get_author_metrics
+from .bulk import (
+    archive_articles, delete_articles, delete_user, publish_articles, purge_spam, purgeable_by, recategorize_articles,
+)
+from .conditional import article_validators, conditional_page, evaluate, listing_validators, set_validators
+from .db import read_from_replica
+from .decorators import async_login_required, async_user_passes_test
+from .caching import CONTENT, STATS, fragment_stats, get_versions
+from .navigation import get_navigation
+from .likes import set_like
 from .forms import LoginForm, RegisterForm, ArticleForm, CommentForm, CategoryForm
+from .page_cache import cache_public_page
+from .pagination import KeysetPaginator, paginate
+from .perf import registry as perf_registry
+from .search import search_articles
+from .stats import get_site_stats
+from .view_counter import pending_views, record_view
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+COMMENTS_PER_PAGE = 20
+DASHBOARD_ARTICLES_PER_PAGE = 10
 
 def is_admin(user):
     """Check if user is an admin (staff or superuser)"""
     return user.is_staff or user.is_superuser
 
+def _count_subquery(model, field):
+    """Correlated COUNT of `model` rows pointing at the outer row through `field`"""
+    rows = model.objects.filter(**{field: OuterRef('pk')}).order_by().values(field)
+    return Coalesce(Subquery(rows.annotate(total=Count('pk')).values('total'), output_field=IntegerField()), 0)
+
 def handler403(request, exception=None):
     """Custom 403 error handler for non-admin users"""
     return render(request, '403.html', status=403)
 
-def home(request):
+@conditional_page(listing_validators)
+@cache_public_page()
+@read_from_replica
+async def home(request):
     """Home page with latest published articles"""
     articles = Article.objects.filter(status='published').select_related('author', 'category')
     
     # Search functionality
     query = request.GET.get('q')
     if query:
-        articles = articles.filter(
-            Q(title__icontains=query) | 
-            Q(content__icontains=query) | 
-            Q(excerpt__icontains=query)
-        )
+        articles = search_articles(articles, query)
     
     # Category filter
     category_id = request.GET.get('category')
     if category_id:
         articles = articles.filter(category_id=category_id)
     
-    # Pagination
-    paginator = Paginator(articles, 6)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Pagination: ranked search results use page numbers, the archive seeks on its ordering
+    if query:
+        page_coro = sync_to_async(paginate)(request, articles, 6)
+    else:
+        page_coro = sync_to_async(paginate)(
+            request, articles.filter(published_at__isnull=False), 6,
+            ordering=('-published_at', '-id'),
+        )
     
-    categories = Category.objects.all()
+    # Sidebar querysets are lazy, so they only hit the database when the
+    # cached sidebar fragments have to be re-rendered
+    sidebar_categories = Category.objects.annotate(
+        published_count=Count('articles', filter=Q(articles__status='published'))
+    )
     
     # Get recent articles for sidebar
     recent_articles = Article.objects.filter(
@@ -55,96 +94,96 @@ def home(request):
         status='published'
     ).select_related('author', 'category').order_by('-views')[:5]
     
-    # Get latest article for header
-    latest_article = Article.objects.filter(
-        status='published'
-    ).order_by('-published_at').first()
-    
-    # Calculate stats
-    total_articles = Article.objects.filter(status='published').count()
-    total_categories = Category.objects.count()
-    total_views = sum(article.views for article in Article.objects.filter(status='published'))
-    total_likes = sum(article.likes.count() for article in Article.objects.filter(status='published'))
+    # The page and the site stats are independent, so they are awaited together
+    page_obj, stats = await asyncio.gather(page_coro, sync_to_async(get_site_stats)())
     
     context = {
         'page_obj': page_obj,
-        'categories': categories,
+        'sidebar_categories': sidebar_categories,
         'query': query,
         'selected_category': category_id,
         'recent_articles': recent_articles,
         'popular_articles': popular_articles,
-        'latest_article': latest_article,
-        'total_articles': total_articles,
-        'total_categories': total_categories,
-        'total_views': total_views,
-        'total_likes': total_likes,
+        'total_articles': stats['published_articles'],
+        'total_categories': stats['categories'],
+        'total_views': stats['views'],
+        'total_likes': stats['likes'],
     }
-    return render(request, 'home.html', context)
-
-@login_required
-def article_detail(request, slug):
+    # Rendering stays in the sync thread: cached sidebar fragments evaluate their
+    # lazy querysets only on a miss
+    return await sync_to_async(render)(request, 'home.html', context)
+
+def _submit_comment(request, article):
+    """Handle the comment form posted to article_detail; returns (form, redirect or None)"""
+    comment_form = CommentForm(request.POST)
+    if comment_form.is_valid():
+        comment = comment_form.save(commit=False)
+        comment.article = article
+        comment.author = request.user
+        comment.is_approved = True  # Auto-approve comments
+        comment.save()
+        messages.success(request, 'Comment posted successfully!')
+        return comment_form, redirect('article_detail', slug=article.slug)
+    return comment_form, None
+
+@async_login_required
+@read_from_replica
+async def article_detail(request, slug):
     """Display individual article with comments"""
-    article = get_object_or_404(Article, slug=slug, status='published')
+    newest_comment = Comment.objects.filter(article=OuterRef('pk')).order_by('-created_at').values('created_at')[:1]
+    article = await aget_object_or_404(
+        Article.objects.select_related('author', 'category').annotate(newest_comment_at=Subquery(newest_comment)),
+        slug=slug, status='published',
+    )
+    user = await request.auser()
     
-    # Increment view count
-    article.views += 1
-    article.save(update_fields=['views'])
+    # Count the view in the buffer; stored views are flushed in batches. This
+    # happens before the conditional check, so a 304 still counts as a view
+    await sync_to_async(record_view)(article.pk)
     
     # Handle comment submission
-    if request.method == 'POST' and request.user.is_authenticated:
-        comment_form = CommentForm(request.POST)
-        if comment_form.is_valid():
-            comment = comment_form.save(commit=False)
-            comment.article = article
-            comment.author = request.user
-            comment.is_approved = True  # Auto-approve comments
-            comment.save()
-            messages.success(request, 'Comment posted successfully!')
-            return redirect('article_detail', slug=slug)
+    if request.method == 'POST':
+        comment_form, response = await sync_to_async(_submit_comment)(request, article)
+        if response is not None:
+            return response
     else:
+        etag, last_modified, response = await sync_to_async(evaluate)(
+            request, partial(article_validators, article=article)
+        )
+        if response is not None:
+            return set_validators(request, response, etag, last_modified)
         comment_form = CommentForm()
     
-    # Get all comments (since they're auto-approved)
-    comments = article.comments.all()
-    
-    # Get related articles (same category, published, excluding current article)
-    related_articles = Article.objects.filter(
-        category=article.category,
-        status='published'
-    ).exclude(pk=article.pk).order_by('-published_at')[:5]
+    # The pending view count, the first page of comments (later pages come from
+    # comment_list), the like state and the precomputed previous/next/related
+    # links don't depend on each other
+    pending, comments, is_liked, navigation = await asyncio.gather(
+        sync_to_async(pending_views)(article.pk),
+        sync_to_async(_comment_page)(article, request.GET.get('cursor')),
+        article.likes.filter(pk=user.pk).aexists(),
+        sync_to_async(get_navigation)(article),
+    )
+    article.views += pending
     
     # Get popular articles for sidebar
     popular_articles = Article.objects.filter(
         status='published'
     ).exclude(pk=article.pk).order_by('-views')[:5]
     
-    # Get previous and next articles
-    try:
-        previous_article = Article.objects.filter(
-            status='published',
-            published_at__lt=article.published_at
-        ).order_by('-published_at').first()
-    except:
-        previous_article = None
-    
-    try:
-        next_article = Article.objects.filter(
-            status='published',
-            published_at__gt=article.published_at
-        ).order_by('published_at').first()
-    except:
-        next_article = None
-    
     context = {
         'article': article,
         'comments': comments,
         'comment_form': comment_form,
-        'related_articles': related_articles,
+        'is_liked': is_liked,
+        'related_articles': navigation.related,
         'popular_articles': popular_articles,
-        'previous_article': previous_article,
-        'next_article': next_article,
+        'previous_article': navigation.previous,
+        'next_article': navigation.next,
     }
-    return render(request, 'article_detail.html', context)
+    response = await sync_to_async(render)(request, 'article_detail.html', context)
+    if request.method != 'POST':
+        set_validators(request, response, etag, last_modified)
+    return response
 
 def user_login(request):
     """User login view"""
@@ -193,21 +232,14 @@ def register(request):
 @user_passes_test(is_admin)
 def dashboard(request):
     """Admin dashboard for authenticated users"""
-    user_articles = Article.objects.filter(author=request.user).order_by('-created_at')
-    
-    # Basic stats
-    user_articles_count = user_articles.count()
-    total_views = sum(article.views for article in user_articles)
-    total_likes = sum(article.likes.count() for article in user_articles)
-    total_comments = sum(article.comments.count() for article in user_articles)
+    user_articles = Article.objects.filter(
+        author=request.user
+    ).select_related('category').order_by('-created_at')
+    # One page of the table, so the dashboard costs the same however much the author wrote
+    page_obj = paginate(request, user_articles, DASHBOARD_ARTICLES_PER_PAGE, ordering=('-created_at', '-id'))
     
-    # Performance metrics
-    avg_views = user_articles_count and total_views // user_articles_count or 0
-    avg_likes = user_articles_count and total_likes // user_articles_count or 0
-    
-    # Calculate engagement rate (likes + comments / views)
-    total_engagement = total_likes + total_comments
-    engagement_rate = total_views and min(100, (total_engagement / total_views) * 100) or 0
+    # Totals, averages and engagement rate, cached per author
+    metrics = get_author_metrics(request.user.pk)
     
     # Recent comments on user's articles
     recent_comments = Comment.objects.filter(
@@ -215,7 +247,6 @@ def dashboard(request):
     ).select_related('author', 'article').order_by('-created_at')[:5]
     
     # Popular categories
-    from django.db.models import Count
     popular_categories = Category.objects.annotate(
         article_count=Count('articles')
     ).order_by('-article_count')[:5]
@@ -235,25 +266,21 @@ def dashboard(request):
         status='published'
     ).order_by('-views')[:5]
     
-    # Get total users for sidebar badge
-    total_users = User.objects.count()
-    
     context = {
-        'user_articles': user_articles,
-        'user_articles_count': user_articles_count,
-        'total_views': total_views,
-        'total_likes': total_likes,
-        'total_comments': total_comments,
-        'avg_views': avg_views,
-        'avg_likes': avg_likes,
-        'avg_views_percentage': min(100, avg_views * 10),  # Simple percentage calculation
-        'avg_likes_percentage': min(100, avg_likes * 20),  # Simple percentage calculation
-        'engagement_rate': round(engagement_rate, 1),
+        'user_articles': page_obj,
+        'user_articles_count': metrics['articles'],
+        'total_views': metrics['views'],
+        'total_likes': metrics['likes'],
+        'total_comments': metrics['comments'],
+        'avg_views': metrics['avg_views'],
+        'avg_likes': metrics['avg_likes'],
+        'avg_views_percentage': metrics['avg_views_percentage'],
+        'avg_likes_percentage': metrics['avg_likes_percentage'],
+        'engagement_rate': metrics['engagement_rate'],
         'recent_comments': recent_comments,
         'popular_categories': popular_categories,
         'recent_activities': recent_activities,
         'popular_articles': popular_articles,
-        'total_users': total_users,
     }
     return render(request, 'dashboard.html', context)
 
@@ -262,27 +289,24 @@ def dashboard(request):
 def article_list(request):
     """List all articles for the current user or all if admin/staff"""
     if request.user.is_superuser or request.user.is_staff:
-        articles = Article.objects.all().order_by('-created_at')
+        articles = Article.objects.select_related('category').order_by('-created_at')
     else:
-        articles = Article.objects.filter(author=request.user).order_by('-created_at')
+        articles = Article.objects.filter(author=request.user).select_related('category').order_by('-created_at')
 
     # Search functionality
     query = request.GET.get('q')
     if query:
-        articles = articles.filter(
-            Q(title__icontains=query) |
-            Q(content__icontains=query) |
-            Q(excerpt__icontains=query)
-        )
+        articles = search_articles(articles, query)
 
     # Status filter
     status = request.GET.get('status')
     if status:
         articles = articles.filter(status=status)
 
-    paginator = Paginator(articles, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    if query:
+        page_obj = paginate(request, articles, 10)
+    else:
+        page_obj = paginate(request, articles, 10, ordering=('-created_at', '-id'))
 
     context = {
         'page_obj': page_obj,
@@ -291,6 +315,33 @@ def article_list(request):
     }
     return render(request, 'article_list.html', context)
 
+@login_required
+@user_passes_test(is_admin)
+@require_POST
+def article_bulk(request):
+    """Publish, archive, move or delete the articles ticked in the article list"""
+    articles = Article.objects.filter(pk__in=request.POST.getlist('articles'))
+    # Like article_edit/article_delete: staff act on their own articles only
+    if not request.user.is_superuser:
+        articles = articles.filter(author=request.user)
+    action = request.POST.get('action')
+
+    if action == 'publish':
+        messages.success(request, f'Published {publish_articles(articles)} article(s).')
+    elif action == 'archive':
+        messages.success(request, f'Archived {archive_articles(articles)} article(s).')
+    elif action == 'move':
+        category = Category.objects.filter(pk=request.POST.get('category') or None).first()
+        if category is None:
+            messages.error(request, 'Choose a category to move the articles to.')
+        else:
+            messages.success(request, f'Moved {recategorize_articles(articles, category)} article(s) to {category.name}.')
+    elif action == 'delete':
+        messages.success(request, f'Deleted {delete_articles(articles)} article(s).')
+    else:
+        messages.error(request, 'Choose an action.')
+    return redirect('article_list')
+
 @login_required
 @user_passes_test(is_admin)
 def article_create(request):
@@ -302,6 +353,7 @@ def article_create(request):
             article.author = request.user
             article.slug = slugify(article.title)
             article.save()
+            form.save_m2m()
             messages.success(request, 'Article created successfully!')
             return redirect('article_list')
     else:
@@ -325,6 +377,7 @@ def article_edit(request, slug):
             article = form.save(commit=False)
             article.slug = slugify(article.title)
             article.save()
+            form.save_m2m()
             messages.success(request, 'Article updated successfully!')
             return redirect('article_list')
     else:
@@ -354,7 +407,7 @@ def article_delete(request, slug):
 @user_passes_test(is_admin)
 def category_list(request):
     """List all categories"""
-    categories = Category.objects.all().order_by('name')
+    categories = Category.objects.annotate(article_count=Count('articles')).order_by('name')
     return render(request, 'category_list.html', {'categories': categories})
 
 @login_required
@@ -412,20 +465,35 @@ def category_delete(request, pk):
     return render(request, 'category_confirm_delete.html', {'category': category})
 
 @login_required
+@require_POST
 def like_unlike(request, slug):
-    """Like or unlike an article"""
-    article = get_object_or_404(Article, slug=slug, status='published')
-    
-    if request.method == 'POST':
-        if article.is_liked_by(request.user):
-            # Unlike
-            article.likes.remove(request.user)
-            messages.info(request, 'Article unliked!')
-        else:
-            # Like
-            article.likes.add(request.user)
-            messages.success(request, 'Article liked!')
-    
+    """
+    Like or unlike an article.
+
+    Toggles by default; an `action` of "like" or "unlike" makes the request
+    idempotent. AJAX callers get {"liked", "like_count"} back as JSON instead
+    of a redirect, so a click never costs a page render.
+    """
+    action = request.POST.get('action')
+    if action not in (None, '', 'like', 'unlike'):
+        return JsonResponse({'error': 'action must be "like" or "unlike"'}, status=400)
+    row = Article.objects.filter(slug=slug, status='published').values_list('pk', 'author_id').first()
+    if row is None:
+        raise Http404('No Article matches the given query.')
+
+    liked, like_count = set_like(
+        row[0], request.user.pk, liked={'like': True, 'unlike': False}.get(action), author_id=row[1],
+    )
+    wants_json = request.headers.get('x-requested-with') == 'XMLHttpRequest' or (
+        request.accepts('application/json') and not request.accepts('text/html')
+    )
+    if wants_json:
+        return JsonResponse({'liked': liked, 'like_count': like_count})
+
+    if liked:
+        messages.success(request, 'Article liked!')
+    else:
+        messages.info(request, 'Article unliked!')
     return redirect('article_detail', slug=slug)
 
 @login_required
@@ -505,12 +573,44 @@ def comment_create(request, slug):
                 return JsonResponse({'success': False, 'error': 'Invalid form'}, status=400)
     return redirect('article_detail', slug=slug)
 
+def _comment_page(article, cursor=None):
+    comments = article.comments.select_related('author')
+    return KeysetPaginator(comments, COMMENTS_PER_PAGE, ('-created_at', '-id')).get_page(cursor)
+
+@async_login_required
+@read_from_replica
+async def comment_list(request, slug):
+    """JSON page of an article's comments, for the "Load more comments" button"""
+    article = await aget_object_or_404(Article.objects.only('pk', 'slug'), slug=slug, status='published')
+    page = await sync_to_async(_comment_page)(article, request.GET.get('cursor'))
+    html = await sync_to_async(lambda: ''.join(
+        render_to_string('comment_item.html', {'comment': comment}, request=request)
+        for comment in page
+    ))()
+    return JsonResponse({
+        'comments': [
+            {
+                'id': comment.id,
+                'author': comment.author.username,
+                'content': comment.content,
+                'created_at': comment.created_at.isoformat(),
+            }
+            for comment in page
+        ],
+        'html': html,
+        'has_next': page.has_next(),
+        'next_url': f"{reverse('comment_list', args=[slug])}?{page.next_query}" if page.has_next() else None,
+    })
+
 # User Management Views
 @login_required
 @user_passes_test(is_admin)
 def user_list(request):
     """List all users for admin management"""
-    users = User.objects.all().order_by('-date_joined')
+    users = User.objects.annotate(
+        article_total=_count_subquery(Article, 'author'),
+        comment_total=_count_subquery(Comment, 'author'),
+    ).order_by('-date_joined')
     
     # Search functionality
     query = request.GET.get('q')
@@ -529,22 +629,22 @@ def user_list(request):
     elif staff_filter == 'false':
         users = users.filter(is_staff=False, is_superuser=False)
     
-    paginator = Paginator(users, 15)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate(request, users, 15, ordering=('-date_joined', '-id'))
     
     # Stats
-    total_users = User.objects.count()
-    staff_users = User.objects.filter(is_staff=True).count()
-    active_users = User.objects.filter(is_active=True).count()
+    totals = User.objects.aggregate(
+        total=Count('pk'),
+        staff=Count('pk', filter=Q(is_staff=True)),
+        active=Count('pk', filter=Q(is_active=True)),
+    )
     
     context = {
         'page_obj': page_obj,
         'query': query,
         'staff_filter': staff_filter,
-        'total_users': total_users,
-        'staff_users': staff_users,
-        'active_users': active_users,
+        'total_users': totals['total'],
+        'staff_users': totals['staff'],
+        'active_users': totals['active'],
     }
     return render(request, 'user_list.html', context)
 
@@ -556,12 +656,15 @@ def user_detail(request, user_id):
     
     # Get user's articles and comments
     user_articles = Article.objects.filter(author=user_obj).order_by('-created_at')[:5]
-    user_comments = Comment.objects.filter(author=user_obj).order_by('-created_at')[:5]
+    user_comments = Comment.objects.filter(
+        author=user_obj
+    ).select_related('article').order_by('-created_at')[:5]
     
     # Stats
-    total_articles = user_obj.articles.count()
+    metrics = get_author_metrics(user_obj.pk)
+    total_articles = metrics['articles']
     total_comments = user_obj.comments.count()
-    total_likes = sum(article.likes.count() for article in user_obj.articles.all())
+    total_likes = metrics['likes']
     
     context = {
         'user_obj': user_obj,
@@ -601,6 +704,25 @@ def user_toggle_active(request, user_id):
         
     return redirect('user_detail', user_id=user_id)
 
+@login_required
+@user_passes_test(is_admin)
+def user_purge_spam(request, user_id):
+    """Deactivate a spammer and remove all their comments and likes"""
+    if request.method == 'POST':
+        user_obj = get_object_or_404(User, pk=user_id)
+        if user_obj == request.user:
+            messages.error(request, 'You cannot purge your own account.')
+        elif not purgeable_by(request.user, User.objects.filter(pk=user_obj.pk)).exists():
+            messages.error(request, 'Only a superuser can purge a staff account.')
+        else:
+            comments, likes = purge_spam([user_obj.pk])
+            messages.success(
+                request,
+                f'{user_obj.username} has been deactivated; removed {comments} comment(s) and {likes} like(s).',
+            )
+
+    return redirect('user_detail', user_id=user_id)
+
 @login_required
 @user_passes_test(is_admin)
 def user_delete(request, user_id):
@@ -615,7 +737,7 @@ def user_delete(request, user_id):
     if request.method == 'POST':
         # Get user info before deletion for the success message
         username = user_obj.username
-        user_obj.delete()
+        delete_user(user_obj)
         messages.success(request, f'User "{username}" has been deleted successfully.')
         return redirect('user_list')
     
@@ -635,13 +757,14 @@ def user_delete(request, user_id):
 @user_passes_test(is_admin)
 def settings_view(request):
     """Site settings management"""
+    stats = get_site_stats(cached=False)
     context = {
         'site_name': 'College News Portal',
         'site_description': 'Your trusted source for campus updates',
         'contact_email': 'admin@collegenews.com',
-        'total_articles': Article.objects.count(),
-        'total_users': User.objects.count(),
-        'total_categories': Category.objects.count(),
+        'total_articles': stats['articles'],
+        'total_users': stats['users'],
+        'total_categories': stats['categories'],
     }
     return render(request, 'settings.html', context)
 
@@ -662,12 +785,15 @@ def profile_view(request):
     
     # Get user stats
     user_articles = Article.objects.filter(author=request.user).order_by('-created_at')[:5]
-    user_comments = Comment.objects.filter(author=request.user).order_by('-created_at')[:5]
+    user_comments = Comment.objects.filter(
+        author=request.user
+    ).select_related('article').order_by('-created_at')[:5]
     
     # Stats
-    total_articles = request.user.articles.count()
+    metrics = get_author_metrics(request.user.pk)
+    total_articles = metrics['articles']
     total_comments = request.user.comments.count()
-    total_likes = sum(article.likes.count() for article in request.user.articles.all())
+    total_likes = metrics['likes']
     
     context = {
         'user_articles': user_articles,
@@ -679,12 +805,15 @@ def profile_view(request):
     return render(request, 'profile.html', context)
 
 # About and Contact Views
+@cache_public_page(params=())
+@read_from_replica
 def about_view(request):
     """About page"""
+    stats = get_site_stats()
     context = {
-        'total_articles': Article.objects.count(),
-        'total_users': User.objects.count(),
-        'total_categories': Category.objects.count(),
+        'total_articles': stats['articles'],
+        'total_users': stats['users'],
+        'total_categories': stats['categories'],
     }
     return render(request, 'about.html', context)
 
@@ -704,6 +833,26 @@ def contact_view(request):
     
     return render(request, 'contact.html')
 
+@async_login_required
+@async_user_passes_test(is_admin)
+async def cache_stats(request):
+    """Fragment cache hit/miss counters for this worker process"""
+    return JsonResponse({
+        'pid': os.getpid(),
+        'versions': await sync_to_async(get_versions)(CONTENT, STATS),
+        'fragments': fragment_stats(),
+    })
+
+@login_required
+@user_passes_test(is_admin)
+def perf_stats(request):
+    """Slowest views in this worker process with their repeated queries"""
+    try:
+        limit = max(1, int(request.GET.get('limit', 10)))
+    except ValueError:
+        limit = 10
+    return JsonResponse({'pid': os.getpid(), 'views': perf_registry.report(limit=limit)})
+
 @csrf_exempt  # For demo; for production, use CSRF token in AJAX
 def ajax_delete_comment(request, comment_id):
     if request.method == 'POST':
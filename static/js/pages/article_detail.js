@@ -0,0 +1,60 @@
+function copyToClipboard() {
+    navigator.clipboard.writeText(window.location.href).then(function() {
+        // Show success message
+        const button = event.target.closest('button');
+        const originalHTML = button.innerHTML;
+        button.innerHTML = '<i class="fas fa-check"></i>';
+        button.classList.remove('btn-outline-success');
+        button.classList.add('btn-success');
+
+        setTimeout(function() {
+            button.innerHTML = originalHTML;
+            button.classList.remove('btn-success');
+            button.classList.add('btn-outline-success');
+        }, 2000);
+    });
+}
+
+// Load older comments from the JSON endpoint, one page at a time
+document.getElementById('load-more-comments')?.addEventListener('click', function() {
+    const button = this;
+    button.disabled = true;
+    fetch(button.dataset.url, {headers: {'X-Requested-With': 'XMLHttpRequest'}})
+        .then(response => response.json())
+        .then(data => {
+            document.querySelector('.comments-list').insertAdjacentHTML('beforeend', data.html);
+            if (data.has_next) {
+                button.dataset.url = data.next_url;
+                button.disabled = false;
+            } else {
+                button.parentElement.remove();
+            }
+        })
+        .catch(() => { button.disabled = false; });
+});
+
+// Like/unlike in place; the form still works as a plain POST without JS
+document.getElementById('like-form')?.addEventListener('submit', function(event) {
+    event.preventDefault();
+    const form = this;
+    const button = form.querySelector('button');
+    button.disabled = true;
+    fetch(form.action, {
+        method: 'POST',
+        body: new FormData(form),
+        headers: {'X-Requested-With': 'XMLHttpRequest'},
+    })
+        .then(response => response.json())
+        .then(data => {
+            form.elements.action.value = data.liked ? 'unlike' : 'like';
+            form.querySelector('[data-like-label]').textContent = data.liked ? 'Unlike' : 'Like';
+            document.querySelectorAll('[data-like-count]').forEach(el => { el.textContent = data.like_count; });
+        })
+        .finally(() => { button.disabled = false; });
+});
+
+// Auto-resize textarea
+document.querySelector('textarea[name="content"]')?.addEventListener('input', function() {
+    this.style.height = 'auto';
+    this.style.height = this.scrollHeight + 'px';
+});
@@ -0,0 +1,14 @@
+function previewArticle() {
+    // This would typically open a preview modal or new window
+    alert('Preview functionality would open a preview window here.');
+}
+
+// Auto-save functionality (basic implementation)
+let autoSaveTimer;
+document.getElementById('articleForm').addEventListener('input', function() {
+    clearTimeout(autoSaveTimer);
+    autoSaveTimer = setTimeout(function() {
+        console.log('Auto-saving...');
+        // Implement auto-save logic here
+    }, 2000);
+});
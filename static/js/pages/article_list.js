@@ -0,0 +1,8 @@
+// Select-all checkbox for the bulk actions
+document.querySelectorAll('[data-select-all]').forEach(toggle => {
+    toggle.addEventListener('change', function() {
+        document.querySelectorAll(`input[name="${this.dataset.selectAll}"]`).forEach(box => {
+            box.checked = this.checked;
+        });
+    });
+});
@@ -0,0 +1,40 @@
+// Filter functionality for articles
+document.querySelectorAll('[data-filter]').forEach(button => {
+    button.addEventListener('click', function() {
+        const filter = this.getAttribute('data-filter');
+
+        // Update active button
+        document.querySelectorAll('[data-filter]').forEach(btn => btn.classList.remove('active'));
+        this.classList.add('active');
+
+        // Filter table rows
+        const rows = document.querySelectorAll('tbody tr');
+        rows.forEach(row => {
+            const status = row.getAttribute('data-status');
+            if (filter === 'all' || status === filter) {
+                row.style.display = '';
+            } else {
+                row.style.display = 'none';
+            }
+        });
+    });
+});
+
+// Auto-refresh stats every 30 seconds
+setInterval(() => {
+    // You can add AJAX call here to refresh stats
+    console.log('Refreshing dashboard stats...');
+}, 30000);
+
+// Smooth animations for stat cards
+const statCards = document.querySelectorAll('.stat-card');
+statCards.forEach((card, index) => {
+    card.style.opacity = '0';
+    card.style.transform = 'translateY(20px)';
+
+    setTimeout(() => {
+        card.style.transition = 'all 0.3s ease';
+        card.style.opacity = '1';
+        card.style.transform = 'translateY(0)';
+    }, index * 100);
+});